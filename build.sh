@@ -25,6 +25,8 @@ restore_config() {
         echo "Restoring config.py..."
         mv "$BACKUP_PATH" "$CONFIG_PATH"
     fi
+    # Don't leave a compiled analyzer shadowing the source tree
+    python3 build/compile_analyzer.py --clean > /dev/null
 }
 trap restore_config EXIT
 
@@ -33,8 +35,13 @@ echo "Step 1: Injecting build-time secrets..."
 python3 build/inject_secret.py
 echo ""
 
+# Compile analyzer (optional - skipped if mypyc is not installed)
+echo "Step 2: Compiling analyzer with mypyc..."
+python3 build/compile_analyzer.py || echo "WARNING: analyzer compilation failed - using pure Python"
+echo ""
+
 # Build executable
-echo "Step 2: Building executable with PyInstaller..."
+echo "Step 3: Building executable with PyInstaller..."
 python3 -m PyInstaller veoci-map.spec --clean --noconfirm
 echo ""
 
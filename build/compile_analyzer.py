@@ -0,0 +1,66 @@
+"""Build script - compiles analyzer.py to a C extension with mypyc.
+
+Optional speedup for the relationship extraction hot path. The compiled module
+is placed next to analyzer.py and takes precedence on import; the pure-Python
+source remains the fallback when no compiled module is present.
+
+Usage:
+    python3 build/compile_analyzer.py          # compile in place
+    python3 build/compile_analyzer.py --clean  # remove compiled artifacts
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+MODULE_PATH = Path('src/veoci_mapper/analyzer.py')
+
+
+def clean():
+    """Remove compiled analyzer artifacts so the pure-Python module is used."""
+    for artifact in MODULE_PATH.parent.glob('analyzer*.so'):
+        artifact.unlink()
+        print(f"[OK] Removed {artifact}")
+    for artifact in MODULE_PATH.parent.glob('analyzer*.pyd'):
+        artifact.unlink()
+        print(f"[OK] Removed {artifact}")
+
+
+def compile_analyzer():
+    """Compile analyzer.py in place with mypyc."""
+    if not MODULE_PATH.exists():
+        print(f"ERROR: {MODULE_PATH} not found")
+        sys.exit(1)
+
+    try:
+        from mypyc.build import mypycify
+        from setuptools import setup
+    except ImportError:
+        print("WARNING: mypyc not installed - skipping analyzer compilation")
+        print("         Install with: pip install 'mypy[mypyc]' setuptools")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ext_modules = mypycify(
+            [
+                # Only type-check the analyzer; dependencies are imported at runtime
+                '--follow-imports=silent',
+                '--ignore-missing-imports',
+                str(MODULE_PATH),
+            ],
+            target_dir=str(Path(tmp) / 'c'),
+        )
+        setup(
+            name='veoci-mapper-analyzer',
+            ext_modules=ext_modules,
+            package_dir={'': 'src'},
+            script_args=['build_ext', '--inplace', '--build-temp', str(Path(tmp) / 'temp')],
+        )
+
+    print(f"[OK] Compiled {MODULE_PATH}")
+
+
+if __name__ == '__main__':
+    if '--clean' in sys.argv[1:]:
+        clean()
+    else:
+        compile_analyzer()
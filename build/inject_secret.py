@@ -17,22 +17,25 @@ def inject_key():
         print(f"ERROR: {config_path} not found")
         sys.exit(1)
 
-    content = config_path.read_text()
+    # Work on raw bytes - no decode/encode round trip, no locale dependence
+    content = config_path.read_bytes()
+
+    placeholder = b'_EMBEDDED_GEMINI_KEY: str | None = None'
+    injected = f'_EMBEDDED_GEMINI_KEY: str | None = "{key}"'.encode()
+
+    # Already injected (e.g. re-run without restoring config.py) - nothing to do
+    if injected in content:
+        print(f"[OK] Key already injected in {config_path}")
+        return
 
     # Check if placeholder exists
-    placeholder = '_EMBEDDED_GEMINI_KEY: str | None = None'
     if placeholder not in content:
         print(f"ERROR: Placeholder not found in {config_path}")
-        print("       Expected: {placeholder}")
+        print(f"       Expected: {placeholder.decode()}")
         sys.exit(1)
 
     # Replace placeholder with actual key
-    new_content = content.replace(
-        placeholder,
-        f'_EMBEDDED_GEMINI_KEY: str | None = "{key}"'
-    )
-
-    config_path.write_text(new_content)
+    config_path.write_bytes(content.replace(placeholder, injected))
     print(f"[OK] Injecting API key into {config_path}")
     print(f"[OK] Updated {config_path}")
 
@@ -1,36 +1,70 @@
 """Veoci Solution Mapper - CLI tool to map Veoci solution structure and dependencies."""
 
-from veoci_mapper.analyzer import (
-    FORM_ENTRY,
-    LOOKUP,
-    REFERENCE,
-    TASK,
-    WORKFLOW,
-    WORKFLOW_LOOKUP,
-    Relationship,
-    analyze_solution,
-    extract_relationships,
-    get_referenced_workflow_ids,
-)
-from veoci_mapper.client import (
-    AuthenticationError,
-    NotFoundError,
-    VeociClient,
-    VeociClientError,
-)
-from veoci_mapper.fetcher import (
-    fetch_forms_list,
-    fetch_solution,
-    fetch_workflows_list,
-)
-from veoci_mapper.graph import (
-    build_graph,
-    get_graph_stats,
-    get_node_neighbors,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from veoci_mapper.analyzer import (
+        FORM_ENTRY,
+        LOOKUP,
+        REFERENCE,
+        TASK,
+        WORKFLOW,
+        WORKFLOW_LOOKUP,
+        Relationship,
+        analyze_solution,
+        analyze_task_types,
+        extract_form_fields,
+        extract_relationships,
+        get_referenced_workflow_ids,
+    )
+    from veoci_mapper.client import (
+        AuthenticationError,
+        NotFoundError,
+        VeociClient,
+        VeociClientError,
+    )
+    from veoci_mapper.fetcher import (
+        fetch_forms_list,
+        fetch_solution,
+        fetch_workflows_list,
+    )
+    from veoci_mapper.graph import (
+        build_graph,
+        get_graph_stats,
+        get_node_neighbors,
+    )
 
 __version__ = "0.1.0"
 
+# Public name -> defining submodule. Submodules pull in pydantic, httpx and
+# networkx, so they are imported on first attribute access (PEP 562) rather
+# than whenever any part of the package is imported.
+_LAZY_IMPORTS = {
+    "VeociClient": "veoci_mapper.client",
+    "VeociClientError": "veoci_mapper.client",
+    "AuthenticationError": "veoci_mapper.client",
+    "NotFoundError": "veoci_mapper.client",
+    "fetch_solution": "veoci_mapper.fetcher",
+    "fetch_forms_list": "veoci_mapper.fetcher",
+    "fetch_workflows_list": "veoci_mapper.fetcher",
+    "Relationship": "veoci_mapper.analyzer",
+    "extract_relationships": "veoci_mapper.analyzer",
+    "analyze_solution": "veoci_mapper.analyzer",
+    "analyze_task_types": "veoci_mapper.analyzer",
+    "extract_form_fields": "veoci_mapper.analyzer",
+    "REFERENCE": "veoci_mapper.analyzer",
+    "FORM_ENTRY": "veoci_mapper.analyzer",
+    "LOOKUP": "veoci_mapper.analyzer",
+    "TASK": "veoci_mapper.analyzer",
+    "WORKFLOW": "veoci_mapper.analyzer",
+    "WORKFLOW_LOOKUP": "veoci_mapper.analyzer",
+    "get_referenced_workflow_ids": "veoci_mapper.analyzer",
+    "build_graph": "veoci_mapper.graph",
+    "get_graph_stats": "veoci_mapper.graph",
+    "get_node_neighbors": "veoci_mapper.graph",
+}
+
 __all__ = [
     "VeociClient",
     "VeociClientError",
@@ -42,6 +76,8 @@ __all__ = [
     "Relationship",
     "extract_relationships",
     "analyze_solution",
+    "analyze_task_types",
+    "extract_form_fields",
     "REFERENCE",
     "FORM_ENTRY",
     "LOOKUP",
@@ -53,3 +89,18 @@ __all__ = [
     "get_graph_stats",
     "get_node_neighbors",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names from their submodule on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
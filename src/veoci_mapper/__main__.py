@@ -0,0 +1,24 @@
+"""Entry point for the ``veoci-map`` executable and ``python -m veoci_mapper``.
+
+Answers ``--version`` before the Typer app (and its import tree) is loaded;
+everything else is handed to the CLI.
+"""
+
+import sys
+
+
+def main() -> None:
+    """Run the CLI, fast-pathing a bare version query."""
+    if len(sys.argv) == 2 and sys.argv[1] in ("-v", "--version"):
+        from veoci_mapper.version import __version__
+
+        print(f"veoci-map version {__version__}")
+        return
+
+    from veoci_mapper.cli import main as cli_main
+
+    cli_main()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,43 @@
 """Relationship analysis for Veoci forms and workflows."""
 
-from typing import Any
+import sys
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NamedTuple
 
-from pydantic import BaseModel
+from veoci_mapper.models import Relationship, intern_id
 
 
-class Relationship(BaseModel):
-    """A relationship between forms or to workflows."""
+class _RelationshipRaw(NamedTuple):
+    """Lightweight relationship record used during extraction.
+
+    Mirrors the fields of ``Relationship`` but skips Pydantic validation, so the
+    per-field/per-action hot path stays cheap. Converted to ``Relationship`` at
+    the public API boundary via ``_to_relationship``.
+
+    Fields are ordered so field-based records can be built positionally:
+    the commonly set fields come first, action metadata last.
+    """
 
     source_id: str
-    source_name: str
+    source_name: str | None  # As sent by the API, which may send a null name
     target_id: str
     target_name: str | None
-    target_type: str  # "form" or "workflow"
-    relationship_type: str  # REFERENCE, FORM_ENTRY, LOOKUP, WORKFLOW, ACTION_*
-    field_name: str | None = None  # Optional - actions don't have field names
-    # Action metadata (only populated for action-based relationships)
+    target_type: str
+    relationship_type: str
+    field_name: str | None = None
+    is_subform: bool | None = None
+    target_container_id: str | None = None
     action_id: str | None = None
     action_name: str | None = None
     trigger_type: str | None = None
     automatic: bool | None = None
-    # Task type metadata (only populated for task_type relationships)
-    target_container_id: str | None = None
-    # Reference type metadata (only populated for REFERENCE relationships)
-    is_subform: bool | None = None
+
+
+def _to_relationship(raw: _RelationshipRaw) -> Relationship:
+    """Materialize a raw record as a public Relationship (no re-validation)."""
+    return Relationship.model_construct(**raw._asdict())
 
 
 # Relationship types
@@ -41,104 +55,200 @@ ACTION_CREATES_TASK = "ACTION_CREATES_TASK"
 ACTION_LAUNCHES_TEMPLATE = "ACTION_LAUNCHES_TEMPLATE"
 ACTION_LAUNCHES_PLAN = "ACTION_LAUNCHES_PLAN"
 
+_MISSING: Any = object()
+_PARALLEL_MIN_DEFINITIONS = 50  # Below this, thread start-up outweighs the work
+_EMPTY: dict[str, Any] = {}  # Shared default - never mutate
+
+
+def _fallback_field_name(fields: dict[str, Any], field: dict[str, Any]) -> str:
+    """Label an unnamed field by its key (cold path; fields are usually named)."""
+    field_id = next(key for key, value in fields.items() if value is field)
+    return f"Field {field_id}"
+
+
+def _handle_form_ref(
+    field: dict[str, Any],
+    properties: dict[str, Any],
+    field_type: str,
+    field_name: str | None,
+    form_id: str,
+    form_name: str | None,
+    name_map: dict[str, str],
+) -> _RelationshipRaw | None:
+    """REFERENCE, FORM_ENTRY, LOOKUP - all use sourceFormId."""
+    source_form_id = field.get("sourceFormId")
+    if not source_form_id:
+        return None
+
+    # Prefer the solution's own name for the target form; fall back to the
+    # (possibly stale) sourceForm snapshot embedded in the field
+    target_id = intern_id(source_form_id)
+    target_name = name_map.get(target_id)
+    if target_name is None:
+        source_form = field.get("sourceForm")
+        target_name = source_form.get("name") if source_form else None
+
+    # Extract is_subform for REFERENCE fields
+    # Subforms require explicit referenceNewEntry=true
+    # Absence or false means it's a regular Reference field
+    is_subform = None
+    if field_type == REFERENCE:
+        reference_new_entry = properties.get("referenceNewEntry")
+        is_subform = bool(reference_new_entry)
+
+    return _RelationshipRaw(
+        form_id,
+        form_name,
+        target_id,
+        target_name,
+        "form",
+        field_type,
+        field_name,
+        is_subform,
+    )
+
+
+def _handle_workflow(
+    field: dict[str, Any],
+    properties: dict[str, Any],
+    field_type: str,
+    field_name: str | None,
+    form_id: str,
+    form_name: str | None,
+    name_map: dict[str, str],
+) -> _RelationshipRaw | None:
+    """WORKFLOW and WORKFLOW_LOOKUP - both use properties.processId."""
+    process_id = properties.get("processId")
+    process_name = properties.get("processName")
+
+    if not process_id:
+        return None
+
+    return _RelationshipRaw(
+        form_id,
+        form_name,
+        intern_id(process_id),
+        process_name,
+        "workflow",
+        field_type,  # Preserve actual field type
+        field_name,
+    )
+
+
+def _handle_task(
+    field: dict[str, Any],
+    properties: dict[str, Any],
+    field_type: str,
+    field_name: str | None,
+    form_id: str,
+    form_name: str | None,
+    name_map: dict[str, str],
+) -> _RelationshipRaw | None:
+    """TASK - uses properties.taskTypeFilter and taskTypeContainer."""
+    task_type_id = properties.get("taskTypeFilter")
+    task_type_container = properties.get("taskTypeContainer")
+
+    if not task_type_id:
+        return None
+
+    # Use taskTypeContainer - this is where the task type is defined
+    # Task types can be defined at group level, not the room/solution level
+    container_id_str = (
+        intern_id(task_type_container) if task_type_container else None
+    )
+    return _RelationshipRaw(
+        form_id,
+        form_name,
+        intern_id(task_type_id),
+        None,  # target_name - will be resolved during analysis
+        "task_type",
+        TASK,
+        field_name,
+        None,  # is_subform
+        container_id_str,
+    )
+
+
+# Field type -> relationship handler. Field types not listed here carry no
+# relationships and are skipped with a single dict probe.
+_FIELD_HANDLERS = {
+    REFERENCE: _handle_form_ref,
+    FORM_ENTRY: _handle_form_ref,
+    LOOKUP: _handle_form_ref,
+    WORKFLOW: _handle_workflow,
+    WORKFLOW_LOOKUP: _handle_workflow,
+    TASK: _handle_task,
+}
+
 
 def extract_relationships(
-    form_definition: dict[str, Any], container_id: str | None = None
+    form_definition: dict[str, Any],
+    container_id: str | None = None,
+    name_map: dict[str, str] | None = None,
 ) -> list[Relationship]:
     """Extract all relationships from a single form definition.
 
     Args:
         form_definition: A form definition dict from the Veoci API
         container_id: Optional container ID to detect external relationships
+        name_map: Optional form_id -> form name index used to resolve target names
 
     Returns:
         List of Relationship objects found in this form
     """
-    relationships: list[Relationship] = []
-    form_id = str(form_definition.get("id", ""))
-    form_name = form_definition.get("name", "Unknown")
+    return [
+        _to_relationship(raw)
+        for raw in _extract_relationships(
+            form_definition, container_id=container_id, name_map=name_map
+        )
+    ]
 
-    fields = form_definition.get("fields", {})
-    if not isinstance(fields, dict):
-        return relationships
 
-    for field_id, field in fields.items():
-        field_type = field.get("fieldType", "")
-        field_name = field.get("name", f"Field {field_id}")
-
-        # REFERENCE, FORM_ENTRY, LOOKUP - all use sourceFormId
-        if field_type in {REFERENCE, FORM_ENTRY, LOOKUP}:
-            source_form_id = field.get("sourceFormId")
-            if source_form_id:
-                source_form = field.get("sourceForm", {})
-                target_name = source_form.get("name") if source_form else None
-
-                # Extract is_subform for REFERENCE fields
-                # Subforms require explicit referenceNewEntry=true
-                # Absence or false means it's a regular Reference field
-                is_subform = None
-                if field_type == REFERENCE:
-                    reference_new_entry = field.get("properties", {}).get("referenceNewEntry")
-                    is_subform = bool(reference_new_entry)
-
-                relationships.append(
-                    Relationship(
-                        source_id=form_id,
-                        source_name=form_name,
-                        target_id=str(source_form_id),
-                        target_name=target_name,
-                        target_type="form",
-                        relationship_type=field_type,
-                        field_name=field_name,
-                        is_subform=is_subform,
-                    )
-                )
+def _extract_relationships(
+    form_definition: dict[str, Any],
+    container_id: str | None = None,
+    name_map: dict[str, str] | None = None,
+) -> Iterator[_RelationshipRaw]:
+    """Yield raw relationship records from a single form definition.
 
-        # WORKFLOW and WORKFLOW_LOOKUP - both use properties.processId
-        elif field_type in {WORKFLOW, WORKFLOW_LOOKUP}:
-            properties = field.get("properties", {})
-            process_id = properties.get("processId")
-            process_name = properties.get("processName")
-
-            if process_id:
-                relationships.append(
-                    Relationship(
-                        source_id=form_id,
-                        source_name=form_name,
-                        target_id=str(process_id),
-                        target_name=process_name,
-                        target_type="workflow",
-                        relationship_type=field_type,  # Preserve actual field type
-                        field_name=field_name,
-                    )
-                )
+    Args:
+        form_definition: A form definition dict from the Veoci API
+        container_id: Optional container ID to detect external relationships
+        name_map: Optional form_id -> form name index used to resolve target names
 
-        # TASK - uses properties.taskTypeFilter and taskTypeContainer
-        elif field_type == TASK:
-            properties = field.get("properties", {})
-            task_type_id = properties.get("taskTypeFilter")
-            task_type_container = properties.get("taskTypeContainer")
-
-            if task_type_id:
-                # Use taskTypeContainer - this is where the task type is defined
-                # Task types can be defined at group level, not the room/solution level
-                container_id_str = (
-                    str(task_type_container) if task_type_container else None
-                )
-                relationships.append(
-                    Relationship(
-                        source_id=form_id,
-                        source_name=form_name,
-                        target_id=str(task_type_id),
-                        target_name=None,  # Will be resolved during analysis
-                        target_type="task_type",
-                        relationship_type=TASK,
-                        field_name=field_name,
-                        target_container_id=container_id_str,
-                    )
-                )
+    Yields:
+        Raw relationship records found in this form
+    """
+    # Nothing to do for field-less (or malformed) definitions
+    fields = form_definition.get("fields")
+    if not fields or not isinstance(fields, dict):
+        return
+
+    form_id = intern_id(form_definition.get("id", ""))
+    form_name = form_definition.get("name", "Unknown")
+    if name_map is None:
+        name_map = _EMPTY
+
+    # _FIELD_HANDLERS is the precomputed field type -> handler classification;
+    # bind its lookup once so each field costs a single dict probe
+    get_handler = _FIELD_HANDLERS.get
+
+    for field in fields.values():
+        field_type = field.get("fieldType", "")
+        handler = get_handler(field_type)
+        if handler is None:
+            continue
+        # Intern so comparisons against the (interned) type constants hit the
+        # identity fast path and relationship_type strings are shared
+        field_type = sys.intern(field_type)
 
-    return relationships
+        field_name = field.get("name", _MISSING)
+        if field_name is _MISSING:
+            field_name = _fallback_field_name(fields, field)
+        properties = field.get("properties") or _EMPTY
+        rel = handler(field, properties, field_type, field_name, form_id, form_name, name_map)
+        if rel is not None:
+            yield rel
 
 
 def extract_action_relationships(
@@ -158,10 +268,22 @@ def extract_action_relationships(
     Returns:
         List of Relationship objects derived from actions
     """
-    relationships: list[Relationship] = []
+    return [
+        _to_relationship(raw)
+        for raw in _extract_action_relationships(source_id, source_name, source_type, actions)
+    ]
+
+
+def _extract_action_relationships(
+    source_id: str,
+    source_name: str | None,
+    source_type: str,
+    actions: list[dict[str, Any]],
+) -> Iterator[_RelationshipRaw]:
+    """Yield raw relationship records from custom actions."""
 
     for action in actions:
-        action_id = str(action.get("id", ""))
+        action_id = intern_id(action.get("id", ""))
         action_name = action.get("name", "Unknown Action")
         consequence_type = action.get("consequenceType", "")
         trigger_type = action.get("eventType", "")
@@ -203,7 +325,7 @@ def extract_action_relationships(
             target_id = params.get("targetTaskType")
 
         # Add relationship if we found a valid target
-        if relationship_type and target_id:
+        if relationship_type and target_type and target_id:
             # For task types, extract container ID from action params
             target_container_id = None
             if target_type == "task_type":
@@ -214,21 +336,20 @@ def extract_action_relationships(
                     or params.get("targetContainer")
                 )
 
-            relationships.append(
-                Relationship(
-                    source_id=source_id,
-                    source_name=source_name,
-                    target_id=str(target_id),
-                    target_name=None,  # Will be resolved during analysis
-                    target_type=target_type,
-                    relationship_type=relationship_type,
-                    field_name=None,  # Actions don't have field names
-                    action_id=action_id,
-                    action_name=action_name,
-                    trigger_type=trigger_type,
-                    automatic=automatic,
-                    target_container_id=str(target_container_id) if target_container_id else None,
-                )
+            yield _RelationshipRaw(
+                source_id,
+                source_name,
+                intern_id(target_id),
+                None,  # target_name - will be resolved during analysis
+                target_type,
+                relationship_type,
+                None,  # field_name - actions don't have field names
+                None,  # is_subform
+                intern_id(target_container_id) if target_container_id else None,
+                action_id,
+                action_name,
+                trigger_type,
+                automatic,
             )
 
         # Check for template/plan launches via targetContainerType
@@ -237,52 +358,202 @@ def extract_action_relationships(
         if target_container_type == 5:  # Room Template
             container_id = params.get("targetContainerId")
             if container_id:
-                relationships.append(
-                    Relationship(
-                        source_id=source_id,
-                        source_name=source_name,
-                        target_id=str(container_id),
-                        target_name=None,
-                        target_type="template",
-                        relationship_type=ACTION_LAUNCHES_TEMPLATE,
-                        field_name=None,
-                        action_id=action_id,
-                        action_name=action_name,
-                        trigger_type=trigger_type,
-                        automatic=automatic,
-                    )
+                yield _RelationshipRaw(
+                    source_id,
+                    source_name,
+                    intern_id(container_id),
+                    None,  # target_name
+                    "template",
+                    ACTION_LAUNCHES_TEMPLATE,
+                    None,  # field_name
+                    None,  # is_subform
+                    None,  # target_container_id
+                    action_id,
+                    action_name,
+                    trigger_type,
+                    automatic,
                 )
 
         elif target_container_type == 7:  # Plan
             container_id = params.get("targetContainerId")
             if container_id:
-                relationships.append(
-                    Relationship(
-                        source_id=source_id,
-                        source_name=source_name,
-                        target_id=str(container_id),
-                        target_name=None,
-                        target_type="plan",
-                        relationship_type=ACTION_LAUNCHES_PLAN,
-                        field_name=None,
-                        action_id=action_id,
-                        action_name=action_name,
-                        trigger_type=trigger_type,
-                        automatic=automatic,
-                    )
+                yield _RelationshipRaw(
+                    source_id,
+                    source_name,
+                    intern_id(container_id),
+                    None,  # target_name
+                    "plan",
+                    ACTION_LAUNCHES_PLAN,
+                    None,  # field_name
+                    None,  # is_subform
+                    None,  # target_container_id
+                    action_id,
+                    action_name,
+                    trigger_type,
+                    automatic,
                 )
 
-    return relationships
+
+def get_referenced_ids_by_type(relationships: list[Relationship]) -> dict[str, set[str]]:
+    """Get all target IDs from relationships, grouped by target type, in one pass.
+
+    Returns:
+        Dict mapping target_type ("form", "workflow", "task_type", ...) -> target IDs
+    """
+    referenced: defaultdict[str, set[str]] = defaultdict(set)
+    for r in relationships:
+        referenced[r.target_type].add(r.target_id)
+    return referenced
 
 
 def get_referenced_ids(relationships: list[Relationship]) -> set[str]:
     """Get all target IDs from relationships."""
-    return {r.target_id for r in relationships if r.target_type == "form"}
+    return get_referenced_ids_by_type(relationships).get("form", set())
 
 
 def get_referenced_workflow_ids(relationships: list[Relationship]) -> set[str]:
     """Get all workflow IDs from relationships."""
-    return {r.target_id for r in relationships if r.target_type == "workflow"}
+    return get_referenced_ids_by_type(relationships).get("workflow", set())
+
+
+_DedupKey = tuple[str, str, str, str, str | None, str | None]
+
+
+def _dedup_key(rel: _RelationshipRaw) -> _DedupKey:
+    """All significant fields of a relationship, for deduplication."""
+    # Include action_id to differentiate multiple actions with same targets
+    return (
+        rel.source_id,
+        rel.target_id,
+        rel.target_type,
+        rel.relationship_type,
+        rel.field_name,
+        rel.action_id,  # None for field relationships, unique for actions
+    )
+
+
+def _extend_unique(
+    out: list[_RelationshipRaw],
+    seen: set[_DedupKey],
+    relationships: Iterable[_RelationshipRaw],
+) -> None:
+    """Append relationships to ``out``, skipping any already in ``seen``."""
+    # set.add returns None, so `not seen_add(key)` records the key and keeps
+    # the relationship in one step
+    seen_add = seen.add
+    out.extend(
+        [
+            rel
+            for rel in relationships
+            if (key := _dedup_key(rel)) not in seen and not seen_add(key)
+        ]
+    )
+
+
+def _gil_enabled() -> bool:
+    """Whether the interpreter runs with a GIL (always true before 3.13)."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is None or bool(is_gil_enabled())
+
+
+def _extract_all(
+    definitions: list[dict[str, Any]],
+    container_id: str | None,
+    name_map: dict[str, str],
+) -> Iterable[Iterable[_RelationshipRaw]]:
+    """Extract field relationships for each definition, preserving order.
+
+    Definitions are independent, so on free-threaded builds large solutions
+    are extracted across a thread pool. With the GIL, threads would only
+    contend for it, so extraction stays lazy and sequential.
+    """
+    if len(definitions) < _PARALLEL_MIN_DEFINITIONS or _gil_enabled():
+        return (
+            _extract_relationships(definition, container_id=container_id, name_map=name_map)
+            for definition in definitions
+        )
+
+    with ThreadPoolExecutor() as executor:
+        return list(
+            executor.map(
+                lambda definition: list(
+                    _extract_relationships(
+                        definition, container_id=container_id, name_map=name_map
+                    )
+                ),
+                definitions,
+            )
+        )
+
+
+def _build_name_map(form_definitions: list[dict[str, Any]]) -> dict[str, str]:
+    """Map form ID -> form name, used to resolve target form names."""
+    return {
+        intern_id(form.get("id", "")): form["name"] for form in form_definitions if form.get("name")
+    }
+
+
+def _extend_task_types(
+    out: list[_RelationshipRaw],
+    seen: set[_DedupKey],
+    task_types: dict[str, dict[str, Any]],
+    actions: dict[str, list[dict[str, Any]]] | None,
+    container_id: str | None,
+    name_map: dict[str, str],
+) -> None:
+    """Append unique field and action relationships of each task type to ``out``."""
+    # Task type structure: {"id": ..., "name": ..., "fields": {...}, "container": {...}}
+    task_type_relationships = _extract_all(list(task_types.values()), container_id, name_map)
+    for (task_type_id, task_type), relationships in zip(
+        task_types.items(), task_type_relationships
+    ):
+        # Extract field-based relationships from task type
+        _extend_unique(out, seen, relationships)
+
+        # Extract action-based relationships if actions provided
+        if actions:
+            task_type_name = task_type.get("name", "Unknown Task Type")
+            task_type_actions = actions.get(task_type_id, [])
+
+            if task_type_actions:
+                action_relationships = _extract_action_relationships(
+                    source_id=task_type_id,
+                    source_name=task_type_name,
+                    source_type="task_type",
+                    actions=task_type_actions,
+                )
+                _extend_unique(out, seen, action_relationships)
+
+
+class ExtractedFields(NamedTuple):
+    """Form field relationships extracted ahead of analyze_solution().
+
+    Opaque to callers: produce with extract_form_fields() and pass back via
+    analyze_solution(fields=...).
+    """
+
+    form_definitions: list[dict[str, Any]]
+    container_id: str | None
+    name_map: dict[str, str]
+    per_form: list[list[_RelationshipRaw]]
+
+
+def extract_form_fields(
+    form_definitions: list[dict[str, Any]],
+    container_id: str | None = None,
+) -> ExtractedFields:
+    """Extract field relationships for all forms, without actions.
+
+    Field relationships don't depend on actions, so this can run while actions
+    are still being fetched; analyze_solution() then only adds the actions and
+    deduplicates.
+    """
+    name_map = _build_name_map(form_definitions)
+    per_form = [
+        list(relationships)
+        for relationships in _extract_all(form_definitions, container_id, name_map)
+    ]
+    return ExtractedFields(form_definitions, container_id, name_map, per_form)
 
 
 def analyze_solution(
@@ -290,6 +561,7 @@ def analyze_solution(
     actions: dict[str, list[dict[str, Any]]] | None = None,
     container_id: str | None = None,
     task_types: dict[str, dict[str, Any]] | None = None,
+    fields: ExtractedFields | None = None,
 ) -> list[Relationship]:
     """Analyze all forms and task types in a solution and extract relationships.
 
@@ -300,75 +572,105 @@ def analyze_solution(
         container_id: Optional container ID for external relationship detection
         task_types: Optional dict mapping task_type_id -> task type definition
                     Format: {task_type_id: {"id": ..., "name": ..., "fields": {...}}}
+        fields: Optional result of extract_form_fields() for these same
+                form_definitions and container_id, reused instead of
+                re-extracting field relationships
 
     Returns:
         Combined list of all relationships, deduplicated
     """
-    all_relationships: list[Relationship] = []
+    # Deduplicate inline as relationships are extracted (single pass, no
+    # intermediate list of duplicates)
+    seen: set[_DedupKey] = set()
+    unique_relationships: list[_RelationshipRaw] = []
+
+    form_relationships: Iterable[Iterable[_RelationshipRaw]]
+    if (
+        fields is not None
+        and fields.form_definitions is form_definitions
+        and fields.container_id == container_id
+    ):
+        name_map = fields.name_map
+        form_relationships = fields.per_form
+    else:
+        # Resolve target form names once from the definitions themselves
+        name_map = _build_name_map(form_definitions)
+        form_relationships = _extract_all(form_definitions, container_id, name_map)
 
     # Process forms
-    for form in form_definitions:
+    for form, relationships in zip(form_definitions, form_relationships):
         # Extract field-based relationships
-        relationships = extract_relationships(form, container_id=container_id)
-        all_relationships.extend(relationships)
+        _extend_unique(unique_relationships, seen, relationships)
 
         # Extract action-based relationships if actions provided
         if actions:
-            form_id = str(form.get("id", ""))
+            form_id = intern_id(form.get("id", ""))
             form_name = form.get("name", "Unknown")
             form_actions = actions.get(form_id, [])
 
             if form_actions:
-                action_relationships = extract_action_relationships(
+                action_relationships = _extract_action_relationships(
                     source_id=form_id,
                     source_name=form_name,
                     source_type="form",
                     actions=form_actions,
                 )
-                all_relationships.extend(action_relationships)
+                _extend_unique(unique_relationships, seen, action_relationships)
 
     # Process task types (same pattern as forms)
     if task_types:
-        for task_type_id, task_type in task_types.items():
-            # Extract field-based relationships from task type
-            # Task type structure: {"id": ..., "name": ..., "fields": {...}, "container": {...}}
-            relationships = extract_relationships(
-                task_type, container_id=container_id
-            )
-            all_relationships.extend(relationships)
-
-            # Extract action-based relationships if actions provided
-            if actions:
-                task_type_name = task_type.get("name", "Unknown Task Type")
-                task_type_actions = actions.get(task_type_id, [])
-
-                if task_type_actions:
-                    action_relationships = extract_action_relationships(
-                        source_id=task_type_id,
-                        source_name=task_type_name,
-                        source_type="task_type",
-                        actions=task_type_actions,
-                    )
-                    all_relationships.extend(action_relationships)
-
-    # Deduplicate based on all fields
-    seen = set()
-    unique_relationships = []
-
-    for rel in all_relationships:
-        # Create tuple of all significant fields for deduplication
-        # Include action_id to differentiate multiple actions with same targets
-        key = (
-            rel.source_id,
-            rel.target_id,
-            rel.target_type,
-            rel.relationship_type,
-            rel.field_name,
-            rel.action_id,  # None for field relationships, unique for actions
+        _extend_task_types(
+            unique_relationships, seen, task_types, actions, container_id, name_map
         )
 
-        if key not in seen:
-            seen.add(key)
-            unique_relationships.append(rel)
+    return [_to_relationship(rel) for rel in unique_relationships]
+
+
+def analyze_task_types(
+    task_types: dict[str, dict[str, Any]],
+    form_definitions: list[dict[str, Any]],
+    actions: dict[str, list[dict[str, Any]]] | None = None,
+    container_id: str | None = None,
+    skip_keys: set[tuple[str, str, str | None, str | None]] | None = None,
+) -> list[Relationship]:
+    """Extract relationships from task types only.
+
+    Use this after analyze_solution() has already covered the forms, rather
+    than running analyze_solution() again with task_types and re-scanning
+    every form.
+
+    Args:
+        task_types: Dict mapping task_type_id -> task type definition
+        form_definitions: List of form definition dicts, used only to
+                          resolve target form names
+        actions: Optional dict mapping object IDs to their action lists
+        container_id: Optional container ID for external relationship detection
+        skip_keys: Optional set of (source_id, target_id, field_name, action_id)
+                   keys already known to the caller; matching relationships
+                   are dropped before a Relationship is built for them.
+                   The set is not modified.
 
-    return unique_relationships
+    Returns:
+        List of task type relationships, deduplicated
+    """
+    seen: set[_DedupKey] = set()
+    unique_relationships: list[_RelationshipRaw] = []
+    _extend_task_types(
+        unique_relationships,
+        seen,
+        task_types,
+        actions,
+        container_id,
+        _build_name_map(form_definitions),
+    )
+    if skip_keys is not None:
+        known = set(skip_keys)
+        known_add = known.add
+        unique_relationships = [
+            rel
+            for rel in unique_relationships
+            if (key := (rel.source_id, rel.target_id, rel.field_name, rel.action_id))
+            not in known
+            and not known_add(key)
+        ]
+    return [_to_relationship(rel) for rel in unique_relationships]
@@ -0,0 +1,68 @@
+"""On-disk cache of API definitions, revalidated with ETags."""
+
+import hashlib
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+from veoci_mapper.credentials import get_config_dir
+
+try:
+    # Entries are whole form definitions; orjson reads and writes them in a
+    # fraction of the stdlib's time, straight from/to bytes
+    from orjson import dumps as _json_dumps
+    from orjson import loads as _json_loads
+except ImportError:
+    import json
+
+    def _json_dumps(obj: Any) -> bytes:  # type: ignore[misc]
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads  # type: ignore[assignment]
+
+
+class DefinitionCache:
+    """
+    Stores definition responses with their ETag, one file per object.
+
+    Entries are only written when the API sends an ETag, and are only reused
+    after the server confirms them with 304 Not Modified, so the cache can
+    never serve a stale definition.
+
+    Usage:
+        cache = DefinitionCache("https://veoci.com")
+        entry = cache.get("form-123")  # (etag, body) or None
+        cache.set("form-123", etag, body)
+    """
+
+    def __init__(self, base_url: str, directory: Path | None = None):
+        # Separate namespace per server so IDs from different hosts never mix
+        host_key = hashlib.sha256(base_url.rstrip("/").encode()).hexdigest()[:16]
+        self.directory = (directory or get_config_dir() / "cache") / host_key
+
+    def _path(self, object_id: str) -> Path:
+        return self.directory / f"{hashlib.sha256(object_id.encode()).hexdigest()}.json"
+
+    def get(self, object_id: str) -> tuple[str, Any] | None:
+        """Return the cached (etag, body) for an object, or None."""
+        try:
+            data = _json_loads(self._path(object_id).read_bytes())
+            return data["etag"], data["body"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def set(self, object_id: str, etag: str, body: Any) -> None:
+        """Store a response body under its ETag (best effort)."""
+        path = self._path(object_id)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(_json_dumps({"etag": etag, "body": body}))
+            # Definitions are customer data - same permissions as the saved PAT
+            if sys.platform != "win32":
+                tmp_path.chmod(0o600)
+            os.replace(tmp_path, path)  # Atomic, so readers never see partial files
+        except (OSError, TypeError):
+            # TypeError: body not encodable by orjson (e.g. an int beyond 64 bits)
+            pass
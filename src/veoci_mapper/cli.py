@@ -2,44 +2,75 @@
 
 import asyncio
 import logging
+import os
+import re
+import sys
+import tempfile
+from collections.abc import Coroutine
+from functools import cache, lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
 
-import questionary
 import typer
-from dotenv import load_dotenv
-from rich.console import Console
-from rich.logging import RichHandler
-from rich.panel import Panel
-
-from veoci_mapper.analyzer import analyze_solution, get_referenced_ids, get_referenced_workflow_ids
-from veoci_mapper.client import AuthenticationError, VeociClient
-from veoci_mapper.credentials import get_saved_pat, mask_pat, save_pat
-from veoci_mapper.fetcher import (
-    fetch_all_task_type_definitions,
-    fetch_external_forms,
-    fetch_external_task_types,
-    fetch_external_workflows,
-    fetch_solution,
-)
-from veoci_mapper.graph import build_graph, get_graph_stats
-from veoci_mapper.output import (
-    export_dashboard,
-    export_json,
-    export_markdown,
-    export_mermaid,
-    generate_basic_markdown,
-    generate_markdown_summary,
-    open_in_browser,
-)
+
 from veoci_mapper.version import __version__, check_for_update, get_download_url
 
-load_dotenv()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from veoci_mapper.analyzer import Relationship
+
+# Settings that a .env file may supply; when all are already exported there
+# is nothing for load_dotenv to add, so its directory walk is skipped
+_DOTENV_KEYS = ("VEOCI_TOKEN", "VEOCI_BASE_URL", "VEOCI_CONCURRENCY", "GEMINI_API_KEY")
+
+# Checked before any network or event loop work so bad input fails fast.
+# Container IDs are interpolated into API paths, so only plain ID characters.
+_BASE_URL_RE = re.compile(r"^https?://[^\s/]+")
+_CONTAINER_ID_RE = re.compile(r"^[A-Za-z0-9_-]+$")
+_INVALID_CONTAINER_MSG = "Container ID may only contain letters, digits, '-' and '_'"
+
+# Output files run_map can write, selected with --format
+OUTPUT_FORMATS = frozenset({"html", "json", "mmd", "md"})
+
+# Shared read-only default for optional nested objects in API payloads
+_EMPTY: dict[str, Any] = {}
+
+
+@lru_cache(maxsize=1)
+def _load_dotenv() -> None:
+    """Load a .env file into the environment, at most once per process."""
+    if all(key in os.environ for key in _DOTENV_KEYS):
+        return
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
 
 app = typer.Typer(
     name="veoci-map",
     help="Map Veoci solution relationships and visualize form connections.",
 )
-console = Console()
+
+
+@cache
+def get_console() -> "Console":
+    """Return the shared Rich console, creating it on first use.
+
+    When stdout is not a terminal, color styling and highlighting are skipped.
+    """
+    from rich.console import Console
+
+    interactive = sys.stdout.isatty() or bool(os.environ.get("FORCE_COLOR"))
+    return Console(no_color=not interactive, highlight=interactive)
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `cli.console` working for importers without building it at import time
+    if name == "console":
+        return get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def version_callback(value: bool) -> None:
@@ -51,16 +82,25 @@ def version_callback(value: bool) -> None:
 
 def configure_logging(debug: bool = False) -> None:
     """Configure logging level based on debug flag."""
+    from rich.logging import RichHandler
+
     level = logging.DEBUG if debug else logging.WARNING
+
+    # Already configured at this level (repeat in-process invocations): keep
+    # the existing handler rather than tearing it down and rebuilding it
+    root = logging.getLogger()
+    if root.level == level and any(isinstance(h, RichHandler) for h in root.handlers):
+        return
+
     logging.basicConfig(
         level=level,
         format="%(message)s",
-        handlers=[RichHandler(console=console)],
+        handlers=[RichHandler(console=get_console())],
         force=True,  # Allow reconfiguration
     )
 
 
-def validate_output_path(output_dir: Path, console: Console) -> None:
+def validate_output_path(output_dir: Path, console: "Console") -> None:
     """Create output directory if needed. Shows error if user-specified path fails."""
     try:
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -76,14 +116,137 @@ def validate_output_path(output_dir: Path, console: Console) -> None:
         raise typer.Exit(1)
 
 
+def _run_async(main: Coroutine[Any, Any, None]) -> None:
+    """Run a coroutine to completion, on a libuv-backed loop when available.
+
+    uvloop (winloop on Windows) cuts per-task overhead for the HTTP fan-out.
+    It is imported here rather than at module level so `--help` and argument
+    errors never load it; without it the stdlib loop is used.
+    """
+    try:
+        if sys.platform == "win32":
+            from winloop import run
+        else:
+            from uvloop import run
+    except ImportError:
+        run = asyncio.run
+    run(main)
+
+
+def _parse_formats(values: list[str] | None) -> frozenset[str]:
+    """Parse repeated and/or comma-separated --format values; all if none given."""
+    formats = frozenset(
+        fmt for value in values or () for fmt in value.lower().replace(" ", "").split(",") if fmt
+    )
+    unknown = formats - OUTPUT_FORMATS
+    if unknown:
+        raise typer.BadParameter(
+            f"unknown format {', '.join(sorted(unknown))} "
+            f"(choose from {', '.join(sorted(OUTPUT_FORMATS))})",
+            param_hint="'--format'",
+        )
+    return formats or OUTPUT_FORMATS
+
+
+async def _with_update_check(mapping: Coroutine[Any, Any, None]) -> None:
+    """Run a mapping while checking for a newer release in the background.
+
+    The check is a blocking HTTP call of up to a few seconds; running it in a
+    worker thread on the mapping's event loop takes it off the critical path.
+    Its notice is printed after the mapping, including one that failed.
+    """
+    update_check = asyncio.create_task(asyncio.to_thread(check_for_update))
+    try:
+        await mapping
+    finally:
+        # Awaited even when mapping fails, so the notice is not lost and the
+        # check is not left pending at loop shutdown
+        new_version = await update_check
+        if new_version:
+            typer.echo(f"[Update available: v{new_version}] {get_download_url()}", err=True)
+
+
+def _write_bundle(paths: list[Path], bundle_path: Path) -> Path:
+    """Zip exported files in memory and write the archive in a single pass."""
+    import io
+    import zipfile
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for path in paths:
+            archive.write(path, arcname=path.name)
+    bundle_path.write_bytes(buffer.getbuffer())
+    return bundle_path
+
+
+class _References(NamedTuple):
+    """IDs referenced by a batch of relationships."""
+
+    form_ids: set[str]
+    workflow_ids: set[str]
+    task_type_refs: set[tuple[str, str]]  # (task_type_id, container_id)
+
+
+def _collect_references(relationships: list["Relationship"]) -> _References:
+    """Collect referenced form IDs, workflow IDs and task type refs in one pass."""
+    refs = _References(set(), set(), set())
+    add_form, add_workflow, add_task_type = (
+        refs.form_ids.add,
+        refs.workflow_ids.add,
+        refs.task_type_refs.add,
+    )
+    for r in relationships:
+        target_type = r.target_type
+        if target_type == "form":
+            add_form(r.target_id)
+        elif target_type == "workflow":
+            add_workflow(r.target_id)
+        elif target_type == "task_type" and r.target_container_id:
+            add_task_type((r.target_id, r.target_container_id))
+    return refs
+
+
 async def run_map(
     room_id: str,
     token: str,
     base_url: str,
     output_dir: Path,
     auto_open: bool = True,
+    max_connections: int = 32,
+    concurrency: int = 20,
+    formats: frozenset[str] = OUTPUT_FORMATS,
+    use_cache: bool = True,
+    bundle: bool = False,
 ) -> None:
-    """Main mapping logic."""
+    """Main mapping logic.
+
+    Only the outputs named in ``formats`` (see OUTPUT_FORMATS) are written.
+    With ``bundle``, they are written to ``output_dir`` as one solution.zip.
+    """
+    # Deferred so `--help`, `--version` and argument errors don't pay for the
+    # httpx / pydantic / networkx / output import tree
+    from rich.panel import Panel
+
+    # Output backends are imported on first use, so only requested formats load
+    from veoci_mapper import output
+    from veoci_mapper.analyzer import (
+        ExtractedFields,
+        analyze_solution,
+        analyze_task_types,
+        extract_form_fields,
+    )
+    from veoci_mapper.cache import DefinitionCache
+    from veoci_mapper.client import AuthenticationError, VeociClient
+    from veoci_mapper.fetcher import (
+        fetch_all_task_type_definitions,
+        fetch_external_forms,
+        fetch_external_task_types,
+        fetch_external_workflows,
+        fetch_solution,
+    )
+    from veoci_mapper.graph import build_graph, get_graph_stats
+
+    console = get_console()
 
     console.print(Panel(f"Mapping solution in room [bold]{room_id}[/bold]"))
     console.print(f"[dim]Output directory:[/dim] {output_dir.absolute()}\n")
@@ -92,59 +255,119 @@ async def run_map(
     validate_output_path(output_dir, console)
 
     try:
-        async with VeociClient(token=token, base_url=base_url) as client:
+        async with VeociClient(
+            token=token, base_url=base_url, max_connections=max_connections
+        ) as client:
+            # One bound on in-flight requests across every (overlapping) phase
+            semaphore = asyncio.Semaphore(concurrency)
+
             # Fetch solution data
-            solution = await fetch_solution(client, room_id)
+            # Form field relationships don't need actions, so extract them in a
+            # worker thread while fetch_solution downloads actions
+            field_extraction: list[asyncio.Task[ExtractedFields]] = []
+
+            def start_field_extraction(form_definitions: list[dict[str, Any]]) -> None:
+                field_extraction.append(
+                    asyncio.create_task(
+                        asyncio.to_thread(extract_form_fields, form_definitions, room_id)
+                    )
+                )
+
+            definition_cache = DefinitionCache(base_url) if use_cache else None
+            solution = await fetch_solution(
+                client,
+                room_id,
+                max_concurrent=concurrency,
+                cache=definition_cache,
+                on_form_definitions=start_field_extraction,
+                semaphore=semaphore,
+            )
+            fields = await field_extraction[0] if field_extraction else None
 
             # Extract actions from solution
             actions = solution.get("actions", {})
 
-            # Fetch full definitions for solution task types
-            task_types_list = solution.get("task_types", [])
-            if task_types_list:
+            async def fetch_solution_task_types() -> list[dict[str, Any]]:
+                """Fetch full definitions for solution task types."""
+                task_types_list = solution.get("task_types", [])
+                if not task_types_list:
+                    return []
                 console.print(
                     f"[dim]Fetching {len(task_types_list)} task type definitions...[/dim]"
                 )
                 # Extract container ID from each task type, or fall back to room_id
                 task_type_refs = [
-                    (str(tt.get("categoryId")), str(tt.get("container", {}).get("id", room_id)))
+                    (
+                        str(tt.get("categoryId")),
+                        str((tt.get("container") or _EMPTY).get("id", room_id)),
+                    )
                     for tt in task_types_list
                 ]
                 solution_task_types_dict = await fetch_all_task_type_definitions(
                     client,
                     task_type_refs,
+                    semaphore=semaphore,
                 )
-                solution_task_types = list(solution_task_types_dict.values())
                 console.print(
-                    f"[green]Fetched {len(solution_task_types)} task type definitions[/green]"
+                    f"[green]Fetched {len(solution_task_types_dict)} task type definitions[/green]"
                 )
-            else:
-                solution_task_types = []
+                return list(solution_task_types_dict.values())
 
-            # Analyze relationships (field + action)
+            # Analyze relationships (field + action). This pass doesn't use task
+            # type definitions, so it runs in a worker thread while they download.
             console.print("[dim]Analyzing relationships...[/dim]")
-            relationships = analyze_solution(
-                solution["form_definitions"],
-                actions=actions,
-                container_id=solution.get("container_id"),
+            solution_task_types, relationships = await asyncio.gather(
+                fetch_solution_task_types(),
+                asyncio.to_thread(
+                    analyze_solution,
+                    solution["form_definitions"],
+                    actions=actions,
+                    container_id=solution.get("container_id"),
+                    fields=fields,
+                ),
             )
             console.print(f"[green]Found {len(relationships)} relationships[/green]")
-
-            # Extract task type references from relationships
-            task_type_refs = {
-                (r.target_id, r.target_container_id)
-                for r in relationships
-                if r.target_type == "task_type" and r.target_container_id
-            }
+            # The extracted fields (and the finished extraction task) hold the
+            # form definitions; release them along with solution's copy below
+            del fields
+            field_extraction.clear()
+
+            # Start fetching external forms and workflows referenced so far; task
+            # type relationships are resolved meanwhile and any extra references
+            # they add are fetched afterwards
+            existing_form_ids = {str(f.get("id") or f.get("formId")) for f in solution["forms"]}
+            existing_workflow_ids = {str(w.get("id")) for w in solution["workflows"]}
+            first_pass = _collect_references(relationships)
+            first_pass_form_ids = first_pass.form_ids
+            first_pass_workflow_ids = first_pass.workflow_ids
+            external_forms_task = asyncio.create_task(
+                fetch_external_forms(
+                    client,
+                    first_pass_form_ids,
+                    existing_form_ids,
+                    semaphore=semaphore,
+                    cache=definition_cache,
+                )
+            )
+            external_workflows_task = asyncio.create_task(
+                fetch_external_workflows(
+                    client,
+                    first_pass_workflow_ids,
+                    existing_workflow_ids,
+                    room_id,
+                    semaphore=semaphore,
+                )
+            )
 
             # Fetch external task types (from other containers)
             # Use categoryId as canonical identifier (referenced by TASK fields)
             existing_task_type_ids = {str(tt.get("categoryId")) for tt in solution_task_types}
             external_task_types = await fetch_external_task_types(
                 client,
-                task_type_refs,
+                first_pass.task_type_refs,
                 existing_task_type_ids,
                 room_id,
+                semaphore=semaphore,
             )
 
             # Merge task types
@@ -153,22 +376,32 @@ async def run_map(
 
             # Re-analyze with task types to extract relationships from task type fields
             # This may reveal additional task type references (recursive)
-            if task_types_by_id:
+            task_type_relationships: list[Relationship] = []
+            task_type_pass = _References(set(), set(), set())
+            # Task types without fields or actions can't yield relationships, so
+            # skip the pass entirely when none of them have either
+            if any(
+                tt.get("fields") or actions.get(tt_id) for tt_id, tt in task_types_by_id.items()
+            ):
                 console.print("[dim]Analyzing task type relationships...[/dim]")
-                task_type_relationships = analyze_solution(
+                # Forms were covered by the first pass; only scan task types and
+                # only keep relationships the first pass didn't already find
+                existing_rel_keys = {
+                    (r.source_id, r.target_id, r.field_name, r.action_id) for r in relationships
+                }
+                task_type_relationships = await asyncio.to_thread(
+                    analyze_task_types,
+                    task_types_by_id,
                     solution["form_definitions"],
                     actions=actions,
                     container_id=solution.get("container_id"),
-                    task_types=task_types_by_id,
+                    skip_keys=existing_rel_keys,
                 )
 
                 # Extract any new task type references from task type fields
+                task_type_pass = _collect_references(task_type_relationships)
                 new_task_type_refs = {
-                    (r.target_id, r.target_container_id)
-                    for r in task_type_relationships
-                    if r.target_type == "task_type"
-                    and r.target_container_id
-                    and r.target_id not in task_types_by_id
+                    ref for ref in task_type_pass.task_type_refs if ref[0] not in task_types_by_id
                 }
 
                 # Fetch any newly discovered task types
@@ -182,6 +415,7 @@ async def run_map(
                         new_task_type_refs,
                         set(task_types_by_id.keys()),
                         room_id,
+                        semaphore=semaphore,
                     )
                     # Add to collections
                     all_task_types.extend(more_task_types)
@@ -189,33 +423,43 @@ async def run_map(
                         task_types_by_id[str(tt.get("categoryId"))] = tt
 
                 # Merge unique relationships
-                existing_rel_keys = {
-                    (r.source_id, r.target_id, r.field_name, r.action_id) for r in relationships
-                }
-                added_count = 0
-                for rel in task_type_relationships:
-                    key = (rel.source_id, rel.target_id, rel.field_name, rel.action_id)
-                    if key not in existing_rel_keys:
-                        relationships.append(rel)
-                        existing_rel_keys.add(key)
-                        added_count += 1
-                if added_count > 0:
+                relationships.extend(task_type_relationships)
+                if task_type_relationships:
                     console.print(
-                        f"[green]Found {added_count} additional relationships "
-                        "from task types[/green]"
+                        f"[green]Found {len(task_type_relationships)} additional "
+                        "relationships from task types[/green]"
                     )
 
-            # Fetch external forms
-            existing_form_ids = {str(f.get("id") or f.get("formId")) for f in solution["forms"]}
-            referenced_ids = get_referenced_ids(relationships)
-            external_forms = await fetch_external_forms(client, referenced_ids, existing_form_ids)
-
-            # Fetch external workflows
-            existing_workflow_ids = {str(w.get("id")) for w in solution["workflows"]}
-            referenced_workflow_ids = get_referenced_workflow_ids(relationships)
-            external_workflows = await fetch_external_workflows(
-                client, referenced_workflow_ids, existing_workflow_ids, room_id
+            # Full form definitions (the largest payload) are not needed past
+            # analysis; drop them so they are freed before graph and output work.
+            # Plain JSON data has no reference cycles, so refcounting reclaims
+            # it immediately and a gc.collect() pass would only add a full heap
+            # traversal.
+            solution.pop("form_definitions", None)
+
+            # Fetch forms and workflows only referenced from task types (the
+            # first-pass references are already being fetched)
+            external_forms, external_workflows = await asyncio.gather(
+                external_forms_task, external_workflows_task
             )
+            more_forms, more_workflows = await asyncio.gather(
+                fetch_external_forms(
+                    client,
+                    task_type_pass.form_ids,
+                    existing_form_ids | first_pass_form_ids,
+                    semaphore=semaphore,
+                    cache=definition_cache,
+                ),
+                fetch_external_workflows(
+                    client,
+                    task_type_pass.workflow_ids,
+                    existing_workflow_ids | first_pass_workflow_ids,
+                    room_id,
+                    semaphore=semaphore,
+                ),
+            )
+            external_forms.extend(more_forms)
+            external_workflows.extend(more_workflows)
 
             # Merge external forms and workflows
             all_forms = solution["forms"] + external_forms
@@ -232,15 +476,15 @@ async def run_map(
             )
             stats = get_graph_stats(graph)
 
-            # Print stats
-            console.print("\n[bold]Graph Statistics:[/bold]")
+            # Print stats (collected and rendered in a single console.print)
+            stats_lines = ["\n[bold]Graph Statistics:[/bold]"]
 
             # Build node type breakdown
             node_types = [f"{stats['form_count']} forms", f"{stats['workflow_count']} workflows"]
             if stats.get("task_type_count", 0) > 0:
                 node_types.append(f"{stats['task_type_count']} task types")
 
-            console.print(f"  Nodes: {stats['total_nodes']} ({', '.join(node_types)})")
+            stats_lines.append(f"  Nodes: {stats['total_nodes']} ({', '.join(node_types)})")
 
             # Count external nodes
             external_form_count = sum(1 for f in all_forms if f.get("external", False))
@@ -251,75 +495,140 @@ async def run_map(
                     external_parts.append(f"{external_form_count} forms")
                 if external_task_type_count > 0:
                     external_parts.append(f"{external_task_type_count} task types")
-                console.print(f"  External: {', '.join(external_parts)}")
+                stats_lines.append(f"  External: {', '.join(external_parts)}")
 
-            console.print(f"  Edges: {stats['total_edges']}")
-            console.print(f"  Isolated: {stats['isolated_nodes']}")
-            console.print(f"  Components: {stats['connected_components']}")
+            stats_lines.append(f"  Edges: {stats['total_edges']}")
+            stats_lines.append(f"  Isolated: {stats['isolated_nodes']}")
+            stats_lines.append(f"  Components: {stats['connected_components']}")
+            console.print("\n".join(stats_lines))
 
             # Generate outputs
             console.print("\n[bold]Generating outputs...[/bold]")
             output_dir.mkdir(parents=True, exist_ok=True)
 
-            # Generate markdown first (needed for dashboard)
-            summary = await generate_markdown_summary(
-                container_id=room_id,
-                forms=all_forms,
-                workflows=all_workflows,
-                stats=stats,
-                graph=graph,
-            )
-            if summary is None:
-                summary = generate_basic_markdown(
-                    container_id=room_id,
-                    forms=all_forms,
-                    workflows=all_workflows,
-                    stats=stats,
-                )
-
-            # Dashboard (replaces separate HTML)
-            dashboard_path = export_dashboard(
-                container_id=room_id,
-                forms=all_forms,
-                workflows=all_workflows,
-                relationships=relationships,
-                stats=stats,
-                graph=graph,
-                markdown_summary=summary,
-                output_path=output_dir / "solution.html",
-                base_url=base_url,
-            )
-            console.print(f"  [green]✓[/green] Dashboard: {dashboard_path}")
+            # When bundling, exports go to a local scratch directory and reach
+            # output_dir (possibly a slow network share) as a single file
+            staging = tempfile.TemporaryDirectory(prefix="veoci-map-") if bundle else None
+            export_dir = Path(staging.name) if staging else output_dir
+
+            # Export tasks write into export_dir; on failure they are waited
+            # out before the scratch directory and the data in it are removed
+            background: dict[str, asyncio.Task[Path]] = {}
+            exports: dict[str, asyncio.Task[Path]] = {}
+            dashboard_html: asyncio.Task[str] | None = None
+            try:
+                # JSON and Mermaid don't depend on the summary, so they are written
+                # from worker threads while it is generated
+                if "json" in formats:
+                    background["JSON"] = asyncio.create_task(
+                        asyncio.to_thread(
+                            output.export_json,
+                            container_id=room_id,
+                            forms=all_forms,
+                            workflows=all_workflows,
+                            task_types=all_task_types,
+                            relationships=relationships,
+                            stats=stats,
+                            output_path=export_dir / "solution.json",
+                        )
+                    )
+                if "mmd" in formats:
+                    background["Mermaid"] = asyncio.create_task(
+                        asyncio.to_thread(
+                            output.export_mermaid,
+                            graph=graph,
+                            output_path=export_dir / "solution.mmd",
+                        )
+                    )
+                # The dashboard is rendered now, minus the summary tab, which is
+                # filled in once the summary is ready
+                if "html" in formats:
+                    dashboard_html = asyncio.create_task(
+                        asyncio.to_thread(
+                            output.generate_dashboard_html,
+                            container_id=room_id,
+                            forms=all_forms,
+                            workflows=all_workflows,
+                            relationships=relationships,
+                            stats=stats,
+                            graph=graph,
+                            markdown_summary=None,
+                            base_url=base_url,
+                        )
+                    )
 
-            # JSON
-            json_path = export_json(
-                container_id=room_id,
-                forms=all_forms,
-                workflows=all_workflows,
-                task_types=all_task_types,
-                relationships=relationships,
-                stats=stats,
-                output_path=output_dir / "solution.json",
-            )
-            console.print(f"  [green]✓[/green] JSON: {json_path}")
+                # The summary is only needed for the dashboard and markdown outputs
+                summary = None
+                if "html" in formats or "md" in formats:
+                    # Let the export threads start before the summary request
+                    # blocks the loop
+                    await asyncio.sleep(0)
+                    summary = await output.generate_markdown_summary(
+                        container_id=room_id,
+                        forms=all_forms,
+                        workflows=all_workflows,
+                        stats=stats,
+                        graph=graph,
+                    )
+                    if summary is None:
+                        summary = output.generate_basic_markdown(
+                            container_id=room_id,
+                            forms=all_forms,
+                            workflows=all_workflows,
+                            stats=stats,
+                        )
+
+                # Dashboard (replaces separate HTML) and markdown embed the summary;
+                # write them from worker threads alongside JSON/Mermaid
+                if summary is not None and dashboard_html is not None:
+                    exports["Dashboard"] = asyncio.create_task(
+                        asyncio.to_thread(
+                            output.write_dashboard,
+                            await dashboard_html,
+                            summary,
+                            export_dir / "solution.html",
+                        )
+                    )
+                exports.update(background)
+                # Also save markdown separately
+                if summary is not None and "md" in formats:
+                    exports["Markdown"] = asyncio.create_task(
+                        asyncio.to_thread(
+                            output.export_markdown, summary, export_dir / "solution.md"
+                        )
+                    )
 
-            # Mermaid
-            mmd_path = export_mermaid(
-                graph=graph,
-                output_path=output_dir / "solution.mmd",
-            )
-            console.print(f"  [green]✓[/green] Mermaid: {mmd_path}")
+                paths = await asyncio.gather(*exports.values())
+                written = dict(zip(exports, paths))
+                dashboard_path = written.get("Dashboard")
 
-            # Also save markdown separately
-            md_path = export_markdown(summary, output_dir / "solution.md")
-            console.print(f"  [green]✓[/green] Markdown: {md_path}")
+                if staging is not None:
+                    bundle_path = await asyncio.to_thread(
+                        _write_bundle, paths, output_dir / "solution.zip"
+                    )
+                    dashboard_path = None  # Inside the zip; nothing to open
+                    names = ", ".join(path.name for path in paths)
+                    console.print(f"  [green]✓[/green] Bundle: {bundle_path} ({names})")
+                else:
+                    console.print(
+                        "\n".join(
+                            f"  [green]✓[/green] {label}: {path}" for label, path in written.items()
+                        )
+                    )
+            finally:
+                if staging is not None:
+                    pending: list[asyncio.Task[Any]] = [*background.values(), *exports.values()]
+                    if dashboard_html is not None:
+                        pending.append(dashboard_html)
+                    await asyncio.gather(*pending, return_exceptions=True)
+                    staging.cleanup()
 
             console.print(f"\n[bold green]✓ Complete![/bold green] Outputs saved to {output_dir}")
 
             # Auto-open dashboard
-            if auto_open:
+            if auto_open and dashboard_path is not None:
                 console.print("\n[dim]Opening dashboard in browser...[/dim]")
-                if open_in_browser(dashboard_path):
+                if output.open_in_browser(dashboard_path):
                     console.print("[green]Dashboard opened![/green]")
                 else:
                     msg = (
@@ -336,8 +645,21 @@ async def run_map(
         raise typer.Exit(1)
 
 
+def _validate_container_prompt(value: str) -> bool | str:
+    """Wizard validator (runs on every keystroke): True or an error message."""
+    value = value.strip()
+    if not value:
+        return "Container ID is required"
+    return bool(_CONTAINER_ID_RE.match(value)) or _INVALID_CONTAINER_MSG
+
+
 def run_wizard() -> tuple[str, str]:
     """Run streamlined wizard mode, return (pat, container_id)."""
+    import questionary
+
+    from veoci_mapper.credentials import get_saved_pat, mask_pat, save_pat
+
+    console = get_console()
 
     console.print("\n[bold]Welcome to Veoci Solution Mapper[/bold]\n")
 
@@ -380,13 +702,13 @@ def run_wizard() -> tuple[str, str]:
     # Container
     container = questionary.text(
         "Enter container ID to map:",
-        validate=lambda x: len(x) > 0 or "Container ID is required",
+        validate=_validate_container_prompt,
     ).ask()
 
     if container is None:
         raise typer.Exit(0)
 
-    return pat, container
+    return pat, container.strip()
 
 
 @app.command()
@@ -445,6 +767,35 @@ def map(
         "--no-open",
         help="Don't open dashboard in browser when complete",
     ),
+    max_connections: int = typer.Option(
+        32,
+        "--max-connections",
+        min=1,
+        help="Maximum concurrent HTTP connections to the Veoci API",
+    ),
+    concurrency: int = typer.Option(
+        20,
+        "--concurrency",
+        min=1,
+        envvar="VEOCI_CONCURRENCY",
+        help="Maximum parallel API requests (shared by all fetch phases)",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Always download form definitions instead of revalidating cached copies",
+    ),
+    output_format: list[str] = typer.Option(
+        None,
+        "--format",
+        "-f",
+        help="Outputs to generate: html, json, mmd, md (repeat or comma-separate; default all)",
+    ),
+    bundle: bool = typer.Option(
+        False,
+        "--bundle",
+        help="Write the outputs as a single solution.zip (faster on network drives)",
+    ),
     debug: bool = typer.Option(
         False,
         "--debug",
@@ -464,33 +815,54 @@ def map(
       - JSON export
       - Mermaid diagram
       - Markdown summary
-    """
-
-    # Configure logging based on debug flag
-    configure_logging(debug)
 
-    # Check for updates (non-blocking)
-    new_version = check_for_update()
-    if new_version:
-        typer.echo(f"[Update available: v{new_version}] {get_download_url()}", err=True)
+    Use --format to write only some of these (e.g. --format json,mmd).
+    """
 
     # Resolve legacy aliases (prioritize new flags)
     final_container = container or room_id
     final_token = pat or token
 
-    # If both provided, run directly (scripting mode)
-    if final_token and final_container:
-        asyncio.run(run_map(final_container, final_token, base_url, output, auto_open=not no_open))
-        return
+    # Reject malformed input before logging setup, the update check or the loop
+    if not _BASE_URL_RE.match(base_url):
+        raise typer.BadParameter("must be an http:// or https:// URL", param_hint="'--base-url'")
+    if final_container and not _CONTAINER_ID_RE.match(final_container):
+        raise typer.BadParameter(
+            f"{final_container!r} is not a valid container ID", param_hint="'--container'"
+        )
+    formats = _parse_formats(output_format)
+
+    # Configure logging based on debug flag
+    configure_logging(debug)
 
-    # Otherwise, wizard mode
-    final_token, final_container = run_wizard()
-    console.print()  # Spacing before mapping output
-    asyncio.run(run_map(final_container, final_token, base_url, output, auto_open=True))
+    # If both provided, run directly (scripting mode); otherwise, wizard mode
+    auto_open = not no_open
+    if not (final_token and final_container):
+        final_token, final_container = run_wizard()
+        get_console().print()  # Spacing before mapping output
+        auto_open = True
+
+    _run_async(
+        _with_update_check(
+            run_map(
+                final_container,
+                final_token,
+                base_url,
+                output,
+                auto_open=auto_open,
+                max_connections=max_connections,
+                concurrency=concurrency,
+                formats=formats,
+                use_cache=not no_cache,
+                bundle=bundle,
+            )
+        )
+    )
 
 
 def main() -> None:
     """Entry point for the CLI application."""
+    _load_dotenv()
     app()
 
 
@@ -1,9 +1,134 @@
 """Veoci API client with Bearer token authentication."""
 
-from typing import Any
+import asyncio
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from importlib.util import find_spec
+from typing import Any, Generic, TypeVar
 
 import httpx
 
+try:
+    # Several times faster than stdlib json on large form definitions
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads  # type: ignore[assignment]
+
+
+# GETs are retried with exponential backoff on these transient statuses (and
+# on transport errors such as timeouts), instead of losing a definition
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_ATTEMPTS = 4
+_BACKOFF_INITIAL = 0.5
+_BACKOFF_MAX = 8.0
+# After this many GETs in a row without a 429, allow one more in flight
+_LIMIT_INCREASE_AFTER = 20
+
+
+def _parse_retry_after(value: str) -> float | None:
+    """Seconds from a Retry-After header (delta-seconds or HTTP date)."""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+    except (TypeError, ValueError):
+        return None
+
+
+def _retry_delay(attempt: int, response: httpx.Response | None = None) -> float:
+    """Seconds to wait before retry ``attempt`` (0-based), honoring Retry-After."""
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    delay = _parse_retry_after(retry_after) if retry_after else None
+    if delay is None:
+        # Exponential backoff with jitter so the fan-out doesn't retry in lockstep
+        delay = _BACKOFF_INITIAL * 2**attempt + random.uniform(0, _BACKOFF_INITIAL)
+    return min(max(delay, 0.0), _BACKOFF_MAX)
+
+
+class _AdaptiveLimiter:
+    """
+    Cap on in-flight GETs that adapts to rate limiting (AIMD).
+
+    The cap halves on a 429 and grows by one after a run of successes, up to
+    the initial value, so a throttled backend sees a few requests back off
+    instead of the whole fan-out retrying at once. Entering the limiter yields
+    the current generation; 429s from requests admitted before the last
+    decrease are ignored, so a burst of them halves the cap only once.
+    """
+
+    def __init__(self, limit: int):
+        self.max_limit = max(limit, 1)
+        self.limit = self.max_limit
+        self._active = 0
+        self._successes = 0
+        self._generation = 0
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self) -> int:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+            return self._generation
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        async with self._condition:
+            self._active -= 1
+            # Wake as many waiters as fit under the cap (it may have grown)
+            self._condition.notify(max(self.limit - self._active, 0))
+
+    def record(self, rate_limited: bool, generation: int) -> None:
+        """Shrink the cap after a 429, grow it after enough successes."""
+        if rate_limited:
+            # Requests from an older generation were sent under the larger cap
+            # that has already been halved for
+            if generation == self._generation:
+                self.limit = max(self.limit // 2, 1)
+                self._generation += 1
+            self._successes = 0
+            return
+        self._successes += 1
+        if self._successes >= _LIMIT_INCREASE_AFTER and self.limit < self.max_limit:
+            self.limit += 1
+            self._successes = 0
+
+
+_T = TypeVar("_T")
+
+
+class SharedRequest(Generic[_T]):
+    """
+    A request several callers await together.
+
+    Callers wait through ``join``; one caller being cancelled doesn't cancel
+    the request for the others, but once every caller has been cancelled the
+    request is too. A cancelled request reports ``abandoned`` and should be
+    replaced rather than joined.
+    """
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task[_T]):
+        self.task = task
+        self.waiters = 0
+        # Retrieve the exception even if every caller has stopped waiting
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    @property
+    def abandoned(self) -> bool:
+        return self.task.cancelled() or self.task.cancelling() > 0
+
+    async def join(self) -> _T:
+        self.waiters += 1
+        try:
+            return await asyncio.shield(self.task)
+        finally:
+            self.waiters -= 1
+            if not self.waiters and not self.task.done():
+                self.task.cancel()
+
 
 class VeociClientError(Exception):
     """Base exception for Veoci client errors."""
@@ -33,28 +158,45 @@ class VeociClient:
         self,
         token: str,
         base_url: str = "https://veoci.com",
+        max_connections: int = 32,
     ):
         self.token = token
         self.base_url = base_url.rstrip("/")
-        self._client: httpx.AsyncClient | None = None
-
-    @property
-    def _headers(self) -> dict[str, str]:
-        return {
-            "Authorization": f"Bearer {self.token}",
+        self.max_connections = max_connections
+        self._headers = {
+            "Authorization": f"Bearer {token}",
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
+        self._client: httpx.AsyncClient | None = None
+        # Identical GETs in flight at the same time share one request
+        self._inflight: dict[tuple[str, tuple[tuple[str, Any], ...]], SharedRequest[Any]] = {}
+        self._limiter = _AdaptiveLimiter(max_connections)
 
     async def __aenter__(self) -> "VeociClient":
         self._client = httpx.AsyncClient(
             base_url=f"{self.base_url}/api/v2",
             headers=self._headers,
-            timeout=30.0,
+            # Waiting for a pooled connection is queueing, not a failure: the
+            # fetcher bounds in-flight requests, so never time out on the pool
+            timeout=httpx.Timeout(30.0, pool=None),
+            # Multiplex the fan-out over one TLS connection when the h2 extra
+            # is installed (httpx refuses http2=True without it)
+            http2=find_spec("h2") is not None,
+            # Keep every pooled connection alive so the fetcher's fan-out
+            # reuses sockets instead of re-handshaking TLS
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+                keepalive_expiry=30.0,
+            ),
         )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        # Nothing can use a response once the client is closed
+        for shared in self._inflight.values():
+            shared.task.cancel()
         if self._client:
             await self._client.aclose()
             self._client = None
@@ -71,17 +213,99 @@ class VeociClient:
         response.raise_for_status()
 
         if response.headers.get("content-type", "").startswith("application/json"):
-            return response.json()
+            try:
+                return _json_loads(response.content)
+            except ValueError:
+                # orjson is stricter (e.g. NaN, >64-bit ints); defer to httpx/stdlib
+                return response.json()
         return response.text
 
-    async def get(self, path: str, params: dict[str, Any] | None = None) -> Any:
-        """Make GET request to Veoci API."""
+    async def _get_with_retry(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """
+        Send a GET, retrying transport errors, 429 and 5xx with backoff.
+
+        The last attempt's response (or error) is passed through unchanged.
+        """
+        for attempt in range(_MAX_ATTEMPTS - 1):
+            try:
+                response = await self._send_get(path, params, headers)
+            except httpx.TransportError:
+                await asyncio.sleep(_retry_delay(attempt))
+                continue
+            if response.status_code not in _RETRY_STATUSES:
+                return response
+            await asyncio.sleep(_retry_delay(attempt, response))
+        return await self._send_get(path, params, headers)
+
+    async def _send_get(
+        self,
+        path: str,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+    ) -> httpx.Response:
+        """Send one GET under the adaptive limiter, feeding it the outcome."""
         if not self._client:
             raise VeociClientError("Client not initialized. Use 'async with' context manager.")
 
-        response = await self._client.get(path, params=params)
+        async with self._limiter as generation:
+            response = await self._client.get(path, params=params, headers=headers)
+            self._limiter.record(response.status_code == 429, generation)
+        return response
+
+    async def get(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        """
+        Make GET request to Veoci API.
+
+        Concurrent calls for the same path and params are coalesced into a
+        single request. Each caller gets its own shallow copy of the decoded
+        body, so it may set top-level keys; nested values are shared and must
+        be treated as read-only.
+        """
+        key = (path, tuple(sorted(params.items())) if params else ())
+        shared = self._inflight.get(key)
+        if shared is None or shared.abandoned:
+            shared = SharedRequest(asyncio.ensure_future(self._get(path, params)))
+            self._inflight[key] = shared
+            shared.task.add_done_callback(lambda _: self._forget_request(key, shared))
+        body = await shared.join()
+        return body.copy() if isinstance(body, (dict, list)) else body
+
+    def _forget_request(
+        self,
+        key: tuple[str, tuple[tuple[str, Any], ...]],
+        shared: SharedRequest[Any],
+    ) -> None:
+        # A replacement may already hold the key if this one was abandoned
+        if self._inflight.get(key) is shared:
+            del self._inflight[key]
+
+    async def _get(self, path: str, params: dict[str, Any] | None) -> Any:
+        response = await self._get_with_retry(path, params=params)
         return self._handle_response(response)
 
+    async def get_if_none_match(
+        self,
+        path: str,
+        etag: str | None,
+        params: dict[str, Any] | None = None,
+    ) -> tuple[Any, str | None]:
+        """
+        Make a conditional GET request to Veoci API.
+
+        Returns (body, etag). body is None when the server answers 304 Not
+        Modified for the given etag; etag is the response's ETag, if any.
+        """
+        headers = {"If-None-Match": etag} if etag else None
+        response = await self._get_with_retry(path, params=params, headers=headers)
+        if response.status_code == 304:
+            return None, etag
+        return self._handle_response(response), response.headers.get("etag")
+
     async def post(self, path: str, json: dict[str, Any] | None = None) -> Any:
         """Make POST request to Veoci API."""
         if not self._client:
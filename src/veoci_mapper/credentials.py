@@ -3,9 +3,11 @@
 import json
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def get_config_dir() -> Path:
     """Get platform-appropriate config directory."""
     if sys.platform == "darwin":
@@ -20,25 +22,36 @@ def get_config_dir() -> Path:
     return config_dir
 
 
+@lru_cache(maxsize=1)
+def _read_saved_pat(config_file: Path, mtime_ns: int, size: int) -> str | None:
+    """Parse the PAT from config file; keyed by mtime and size so edits are picked up."""
+    try:
+        data = json.loads(config_file.read_text())
+        return data.get("pat")
+    except Exception:
+        return None
+
+
 def get_saved_pat() -> str | None:
     """Get saved PAT from config file."""
     config_file = get_config_dir() / "config.json"
-    if config_file.exists():
-        try:
-            data = json.loads(config_file.read_text())
-            return data.get("pat")
-        except Exception:
-            pass
-    return None
+    try:
+        stat = config_file.stat()
+    except OSError:
+        return None
+    return _read_saved_pat(config_file, stat.st_mtime_ns, stat.st_size)
 
 
 def save_pat(pat: str) -> None:
     """Save PAT to config file."""
     config_file = get_config_dir() / "config.json"
-    config_file.write_text(json.dumps({"pat": pat}))
-    # Set restrictive permissions on Unix
+    tmp_file = config_file.with_suffix(".json.tmp")
+    tmp_file.write_text(json.dumps({"pat": pat}))
+    # Set restrictive permissions on Unix before the PAT becomes visible
     if sys.platform != "win32":
-        config_file.chmod(0o600)
+        tmp_file.chmod(0o600)
+    # Atomic swap, so a crash mid-write never leaves a truncated config
+    os.replace(tmp_file, config_file)
 
 
 def mask_pat(pat: str) -> str:
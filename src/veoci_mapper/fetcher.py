@@ -2,25 +2,136 @@
 
 import asyncio
 import logging
+import os
+import sys
+from collections.abc import AsyncIterator, Awaitable, Callable
+from functools import partial
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from rich.console import Console
 from rich.progress import Progress, TaskID
 
-from veoci_mapper.client import VeociClient
+from veoci_mapper.cache import DefinitionCache
+from veoci_mapper.client import SharedRequest, VeociClient
 
-console = Console()
+# Off a terminal (CI, pipes) output is plain text unless FORCE_COLOR is set,
+# so skip the color styling and highlighter regexes each print would run
+_interactive = sys.stdout.isatty() or bool(os.environ.get("FORCE_COLOR"))
+console = Console(no_color=not _interactive, highlight=_interactive)
 logger = logging.getLogger(__name__)
 
+# Parallel requests per fetch phase. Wall time is dominated by API round trips,
+# so this sets throughput; keep it within VeociClient's connection pool size.
+# Phases that overlap should share one semaphore (the ``semaphore`` argument)
+# so the bound holds across all of them.
+DEFAULT_MAX_CONCURRENT = 20
+
+# Completed requests per progress bar update in the actions fetch, which can
+# run thousands of requests; per-request updates would mostly be redrawn over
+_PROGRESS_BATCH = 25
+
+# Actions relationship analysis can map: targetObjectType 3=Task, 5=Form,
+# 9=Workflow, or a launch of targetContainerType 5=Room Template, 7=Plan
+_MAPPABLE_TARGET_TYPES = frozenset({3, 5, 9})
+_LAUNCH_CONTAINER_TYPES = frozenset({5, 7})
+
+# Task type definition requests per client, keyed by (task_type_id,
+# container_id). The solution and external phases both ask for task types, so
+# a repeat reuses the first request's definition. Results are shared between
+# callers: copy a definition before changing it.
+_task_type_requests: WeakKeyDictionary[
+    VeociClient, dict[tuple[str, str], SharedRequest[dict[str, Any] | None]]
+] = WeakKeyDictionary()
+
+
+def _print_warnings(warnings: list[str]) -> None:
+    """Print the warnings collected during a fan-out in one console write."""
+    if warnings:
+        console.print("\n".join(f"[yellow]{warning}[/yellow]" for warning in warnings))
+
 
 async def fetch_forms_list(client: VeociClient, container_id: str) -> list[dict[str, Any]]:
     """Fetch list of all forms in a container."""
     return await client.get("/forms", params={"c": container_id})
 
 
-async def fetch_form_definition(client: VeociClient, form_id: str) -> dict[str, Any]:
-    """Fetch full form definition including field schema."""
-    return await client.get(f"/forms/{form_id}")
+# Top-level keys kept from a form definition: identity, plus the container an
+# external form lives in (used by the graph)
+_SCHEMA_FORM_KEYS = ("id", "name", "containerId")
+# The parts of a form definition that relationship analysis reads. Everything
+# else (layouts, options, permissions, ...) is dropped as soon as a definition
+# arrives, so it is neither cached nor held in memory for the whole run.
+_SCHEMA_FIELD_KEYS = ("fieldType", "name", "sourceFormId", "properties")
+_SCHEMA_PROPERTY_KEYS = (
+    "referenceNewEntry",
+    "processId",
+    "processName",
+    "taskTypeFilter",
+    "taskTypeContainer",
+)
+
+
+def _project_field(field: Any) -> Any:
+    """Reduce one field to the keys relationship analysis reads."""
+    if not isinstance(field, dict):
+        return field
+    projected = {key: field[key] for key in _SCHEMA_FIELD_KEYS if key in field}
+    properties = projected.get("properties")
+    if isinstance(properties, dict):
+        projected["properties"] = {
+            key: properties[key] for key in _SCHEMA_PROPERTY_KEYS if key in properties
+        }
+    source_form = field.get("sourceForm")
+    if isinstance(source_form, dict):
+        projected["sourceForm"] = {"name": source_form["name"]} if "name" in source_form else {}
+    elif "sourceForm" in field:
+        projected["sourceForm"] = source_form
+    return projected
+
+
+def _project_form_schema(definition: Any) -> Any:
+    """
+    Reduce a form definition to its identity and relationship field schema.
+
+    The API has no projection parameter, so this is applied client-side.
+    """
+    if not isinstance(definition, dict):
+        return definition
+    projected = {key: definition[key] for key in _SCHEMA_FORM_KEYS if key in definition}
+    fields = definition.get("fields")
+    if isinstance(fields, dict):
+        projected["fields"] = {key: _project_field(field) for key, field in fields.items()}
+    elif "fields" in definition:
+        projected["fields"] = fields
+    return projected
+
+
+async def fetch_form_definition(
+    client: VeociClient,
+    form_id: str,
+    cache: DefinitionCache | None = None,
+) -> dict[str, Any]:
+    """
+    Fetch a form definition's identity and relationship field schema.
+
+    With a cache, a previously seen definition is revalidated by ETag and
+    reused when the server reports it unchanged.
+    """
+    if cache is None:
+        return _project_form_schema(await client.get(f"/forms/{form_id}"))
+
+    cached = cache.get(form_id)
+    body, etag = await client.get_if_none_match(
+        f"/forms/{form_id}", cached[0] if cached else None
+    )
+    if body is None and cached:
+        # Entries written before projection are reduced here
+        return _project_form_schema(cached[1])
+    body = _project_form_schema(body)
+    if etag:
+        cache.set(form_id, etag, body)
+    return body
 
 
 async def fetch_task_type_definition(
@@ -34,32 +145,67 @@ async def fetch_task_type_definition(
     The task type is nested at response["values"]["0"]["data"]["value"]["category"].
     Returns the category object containing id, name, container, fields, etc.
     Returns None if the task type is inaccessible or doesn't exist.
+
+    Each (task_type_id, container_id) is requested once per client; later and
+    concurrent calls share that request's definition, which callers must not
+    modify. A request that found no definition (or was cancelled) is
+    forgotten, so the next call retries it.
     """
+    requests = _task_type_requests.setdefault(client, {})
+    key = (task_type_id, container_id)
+    shared = requests.get(key)
+    if shared is None or shared.abandoned:
+        shared = SharedRequest(
+            asyncio.ensure_future(
+                _fetch_task_type_definition(client, task_type_id, container_id)
+            )
+        )
+        requests[key] = shared
+        shared.task.add_done_callback(
+            lambda task: _forget_unless_found(requests, key, shared, task)
+        )
+    return await shared.join()
+
+
+def _forget_unless_found(
+    requests: dict[tuple[str, str], SharedRequest[dict[str, Any] | None]],
+    key: tuple[str, str],
+    shared: SharedRequest[dict[str, Any] | None],
+    task: asyncio.Task[dict[str, Any] | None],
+) -> None:
+    # Failures come back as None; only a definition is worth keeping
+    found = not task.cancelled() and task.exception() is None and task.result() is not None
+    if not found and requests.get(key) is shared:
+        del requests[key]
+
+
+async def _fetch_task_type_definition(
+    client: VeociClient,
+    task_type_id: str,
+    container_id: str,
+) -> dict[str, Any] | None:
     try:
         response = await client.get(
             "/tasks/create",
             params={"type": task_type_id, "c": container_id}
         )
-        # Navigate nested structure to extract category
-        category = (
-            response
-            .get("values", {})
-            .get("0", {})
-            .get("data", {})
-            .get("value", {})
-            .get("category")
-        )
+        # Navigate nested structure to extract category (indexing directly
+        # rather than chaining .get(key, {}), which builds a dict per level)
+        try:
+            category = response["values"]["0"]["data"]["value"].get("category")
+        except (KeyError, TypeError, AttributeError):
+            category = None
 
         if not category:
             logger.warning(
-                f"Task type {task_type_id} exists but has no category definition"
+                "Task type %s exists but has no category definition", task_type_id
             )
             return None
 
         return category
 
     except Exception as e:
-        logger.warning(f"Failed to fetch task type {task_type_id}: {e}")
+        logger.warning("Failed to fetch task type %s: %s", task_type_id, e)
         return None
 
 
@@ -73,36 +219,97 @@ async def fetch_workflows_list(client: VeociClient, container_id: str) -> list[d
     return await client.get("/workflows", params={"c": container_id})
 
 
-async def fetch_all_form_definitions(
+async def iter_form_definitions(
     client: VeociClient,
     forms: list[dict[str, Any]],
-    max_concurrent: int = 5,
-) -> list[dict[str, Any]]:
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+    cache: DefinitionCache | None = None,
+    progress: Progress | None = None,
+    semaphore: asyncio.Semaphore | None = None,
+) -> AsyncIterator[tuple[str, dict[str, Any]]]:
     """
-    Fetch full definitions for all forms in parallel.
+    Yield (form_id, definition) for each distinct form as its fetch completes.
 
-    Uses semaphore to limit concurrent requests.
+    Lets callers process definitions while later ones are still in flight.
+    Forms whose listing already carries their fields are yielded first,
+    without a request. Uses semaphore to limit concurrent requests. Definitions are revalidated
+    against ``cache`` when one is given. With ``progress``, a task tracks
+    completed definitions; fetch failures are reported together at the end.
     """
-    semaphore = asyncio.Semaphore(max_concurrent)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max_concurrent)
+    warnings: list[str] = []
+
+    # One request per distinct form ID; a form listed more than once shares it
+    unique_forms = {str(form.get("id") or form.get("formId")): form for form in forms}
+
+    task_id: TaskID | None = None
+    if progress:
+        task_id = progress.add_task("Fetching form definitions...", total=len(unique_forms))
 
-    async def fetch_with_semaphore(form: dict[str, Any]) -> dict[str, Any]:
+    async def fetch_with_semaphore(
+        form_id: str, form: dict[str, Any]
+    ) -> tuple[str, dict[str, Any]]:
         async with semaphore:
-            form_id = form.get("id") or form.get("formId")
             try:
-                definition = await fetch_form_definition(client, str(form_id))
-                return definition
+                return form_id, await fetch_form_definition(client, form_id, cache)
             except Exception as e:
-                console.print(f"[yellow]Warning: Failed to fetch form {form_id}: {e}[/yellow]")
-                return form  # Return basic info if definition fetch fails
+                warnings.append(f"Warning: Failed to fetch form {form_id}: {e}")
+                return form_id, form  # Return basic info if definition fetch fails
+            finally:
+                if progress and task_id is not None:
+                    progress.advance(task_id)
+
+    # Listings expanded with the field schema already hold the definition
+    listed: list[tuple[str, dict[str, Any]]] = []
+    tasks: list[asyncio.Task[tuple[str, dict[str, Any]]]] = []
+    for form_id, form in unique_forms.items():
+        if isinstance(form.get("fields"), dict):
+            listed.append((form_id, _project_form_schema(form)))
+        else:
+            tasks.append(asyncio.create_task(fetch_with_semaphore(form_id, form)))
+    if listed and progress and task_id is not None:
+        progress.advance(task_id, len(listed))
+
+    try:
+        for form_definition in listed:
+            yield form_definition
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+        _print_warnings(warnings)
+    finally:
+        # Consumer stopped early: don't leave requests running
+        for task in tasks:
+            task.cancel()
+
+
+async def fetch_all_form_definitions(
+    client: VeociClient,
+    forms: list[dict[str, Any]],
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+    cache: DefinitionCache | None = None,
+    progress: Progress | None = None,
+    semaphore: asyncio.Semaphore | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Fetch full definitions for all forms in parallel.
 
-    tasks = [fetch_with_semaphore(form) for form in forms]
-    return await asyncio.gather(*tasks)
+    Collects iter_form_definitions() into a list in the order of ``forms``.
+    """
+    definitions = {
+        form_id: definition
+        async for form_id, definition in iter_form_definitions(
+            client, forms, max_concurrent, cache, progress, semaphore
+        )
+    }
+    return [definitions[str(form.get("id") or form.get("formId"))] for form in forms]
 
 
 async def fetch_all_task_type_definitions(
     client: VeociClient,
     task_type_refs: list[tuple[str, str]],
-    max_concurrent: int = 5,
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+    semaphore: asyncio.Semaphore | None = None,
 ) -> dict[str, dict[str, Any]]:
     """
     Fetch task type definitions in parallel.
@@ -114,7 +321,8 @@ async def fetch_all_task_type_definitions(
     Returns:
         Dict mapping task_type_id -> task type definition (category object)
     """
-    semaphore = asyncio.Semaphore(max_concurrent)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max_concurrent)
 
     async def fetch_with_semaphore(
         task_type_id: str,
@@ -128,9 +336,10 @@ async def fetch_all_task_type_definitions(
             )
             return (task_type_id, definition)
 
+    # Repeated refs would fetch (and return) the same definition again
     tasks = [
         fetch_with_semaphore(tt_id, c_id)
-        for tt_id, c_id in task_type_refs
+        for tt_id, c_id in dict.fromkeys(task_type_refs)
     ]
     results = await asyncio.gather(*tasks)
 
@@ -146,11 +355,16 @@ async def fetch_external_forms(
     client: VeociClient,
     form_ids: set[str],
     existing_form_ids: set[str],
-    max_concurrent: int = 5,
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+    semaphore: asyncio.Semaphore | None = None,
+    cache: DefinitionCache | None = None,
 ) -> list[dict[str, Any]]:
     """
     Fetch forms that are referenced but not in the main container.
 
+    Forms are fetched like solution forms (fetch_form_definition), so they
+    share ``cache`` entries with them across runs and solutions.
+
     Returns forms with an 'external' flag set to True.
     """
     missing_ids = form_ids - existing_form_ids
@@ -160,20 +374,23 @@ async def fetch_external_forms(
 
     console.print(f"[dim]Fetching {len(missing_ids)} external forms...[/dim]")
 
-    semaphore = asyncio.Semaphore(max_concurrent)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max_concurrent)
+    warnings: list[str] = []
 
     async def fetch_one(form_id: str) -> dict[str, Any] | None:
         async with semaphore:
             try:
-                form = await client.get(f"/forms/{form_id}")
+                form = await fetch_form_definition(client, form_id, cache)
                 form['external'] = True  # Mark as external
                 return form
             except Exception as e:
-                console.print(f"[yellow]Could not fetch external form {form_id}: {e}[/yellow]")
+                warnings.append(f"Could not fetch external form {form_id}: {e}")
                 return None
 
     tasks = [fetch_one(fid) for fid in missing_ids]
     results = await asyncio.gather(*tasks)
+    _print_warnings(warnings)
 
     external_forms = [f for f in results if f is not None]
     console.print(f"[green]Fetched {len(external_forms)} external forms[/green]")
@@ -186,7 +403,8 @@ async def fetch_external_workflows(
     workflow_ids: set[str],
     existing_workflow_ids: set[str],
     container_id: str,
-    max_concurrent: int = 5,
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+    semaphore: asyncio.Semaphore | None = None,
 ) -> list[dict[str, Any]]:
     """
     Fetch workflows that are referenced but not in the main container.
@@ -200,7 +418,8 @@ async def fetch_external_workflows(
 
     console.print(f"[dim]Fetching {len(missing_ids)} external workflows...[/dim]")
 
-    semaphore = asyncio.Semaphore(max_concurrent)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max_concurrent)
 
     async def fetch_one(workflow_id: str) -> dict[str, Any] | None:
         async with semaphore:
@@ -209,7 +428,7 @@ async def fetch_external_workflows(
                 workflow['external'] = True  # Mark as external
                 return workflow
             except Exception as e:
-                logger.warning(f"Could not fetch external workflow {workflow_id}: {e}")
+                logger.warning("Could not fetch external workflow %s: %s", workflow_id, e)
                 return None
 
     tasks = [fetch_one(wid) for wid in missing_ids]
@@ -226,7 +445,8 @@ async def fetch_external_task_types(
     task_type_refs: set[tuple[str, str]],
     existing_task_type_ids: set[str],
     solution_container_id: str,
-    max_concurrent: int = 5,
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+    semaphore: asyncio.Semaphore | None = None,
 ) -> list[dict[str, Any]]:
     """
     Fetch task types that are referenced but not in the main container.
@@ -238,19 +458,21 @@ async def fetch_external_task_types(
 
     Returns task types with 'external' flag set to True for those from other containers.
     """
-    # Filter to only task types we don't already have
-    missing_refs = [
-        (tt_id, c_id)
-        for tt_id, c_id in task_type_refs
-        if tt_id not in existing_task_type_ids
-    ]
+    # Filter to only task types we don't already have, one request per task
+    # type even when it is referenced with more than one container
+    missing: dict[str, str] = {}
+    for tt_id, c_id in sorted(task_type_refs):
+        if tt_id not in existing_task_type_ids:
+            missing.setdefault(tt_id, c_id)
+    missing_refs = list(missing.items())
 
     if not missing_refs:
         return []
 
     console.print(f"[dim]Fetching {len(missing_refs)} external task types...[/dim]")
 
-    semaphore = asyncio.Semaphore(max_concurrent)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max_concurrent)
 
     async def fetch_one(
         task_type_id: str,
@@ -265,6 +487,8 @@ async def fetch_external_task_types(
 
             if task_type is None:
                 return None
+            # The definition is shared with other callers; flag a copy
+            task_type = dict(task_type)
 
             # Mark as external if from different container
             task_type_container = task_type.get("container", {}).get("id")
@@ -315,7 +539,7 @@ async def fetch_task_type_actions(
             params={"object": task_type_id, "container": container_id}
         )
     except Exception as e:
-        logger.warning(f"Failed to fetch actions for task type {task_type_id}: {e}")
+        logger.warning("Failed to fetch actions for task type %s: %s", task_type_id, e)
         return []
 
 
@@ -327,15 +551,50 @@ async def fetch_action_builder(
     try:
         return await client.get(f"/actions/{action_id}/builder")
     except Exception as e:
-        logger.warning(f"Failed to fetch action builder {action_id}: {e}")
+        logger.warning("Failed to fetch action builder %s: %s", action_id, e)
         return None
 
 
+def _mappable_actions(object_id: str, actions: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Keep only the actions relationship analysis can map to a target.
+
+    REST API calls, emails, reports and the like are dropped as their list
+    arrives, so they are neither held for the rest of the run nor rescanned.
+    """
+    mappable = []
+    for action in actions:
+        # Skip REST API actions (no cross-object target)
+        if action.get("consequenceType") == "CALL_REST_API":
+            continue
+        # targetObjectType is inside consequenceParams, not at root level
+        params = action.get("consequenceParams")
+        if not isinstance(params, dict):
+            continue
+        target_type = params.get("targetObjectType")
+        if (
+            target_type in _MAPPABLE_TARGET_TYPES
+            or params.get("targetContainerType") in _LAUNCH_CONTAINER_TYPES
+        ):
+            mappable.append(action)
+        elif target_type is None:
+            # Debug: log why we're not enriching
+            logger.debug(
+                "Action %s on %s: targetObjectType is None - may need builder fetch",
+                action.get("id"),
+                object_id,
+            )
+    return mappable
+
+
 async def fetch_all_object_actions(
     client: VeociClient,
     object_ids: list[str],
     task_type_refs: list[tuple[str, str, str]] | None = None,
-    max_concurrent: int = 5,
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+    progress: Progress | None = None,
+    semaphore: asyncio.Semaphore | None = None,
+    keep_all: bool = False,
 ) -> dict[str, list[dict[str, Any]]]:
     """
     Fetch actions for multiple objects in parallel.
@@ -345,116 +604,159 @@ async def fetch_all_object_actions(
        or /actions?object={id}&container={cid} (task types)
     2. For mappable actions, fetch full config from /actions/{id}/builder
 
+    Requests are run by up to ``max_concurrent`` workers pulling from one
+    queue (one per queued request, up to that cap), so only that many
+    coroutines exist however many objects and actions there are. The phases
+    are pipelined: an object's builder fetches are queued as soon as its
+    action list arrives. With ``progress``, a task tracks completed requests
+    (updated every few completions); its total grows as builder fetches are
+    queued.
+
     Args:
         object_ids: List of form/workflow IDs
         task_type_refs: Optional list of (task_type_id, categoryId, container_id) tuples
         max_concurrent: Max concurrent requests
+        keep_all: Keep every action, not just those analysis can map (debugging)
 
     Returns dict mapping object_id/categoryId -> list of actions.
     Uses semaphore to limit concurrent requests.
     """
-    semaphore = asyncio.Semaphore(max_concurrent)
+    task_type_refs = task_type_refs or []
+    if not object_ids and not task_type_refs:
+        return {}
+
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max_concurrent)
+    warnings: list[str] = []
+    queue: asyncio.Queue[Callable[[], Awaitable[None]]] = asyncio.Queue()
+    workers: list[asyncio.Task[None]] = []
+    errors: list[Exception] = []
+
+    # Filled in place as lists arrive; pre-seeding the keys keeps them in
+    # request order, independent of completion order
+    actions_by_object: dict[str, list[dict[str, Any]]] = {
+        object_id: [] for object_id in object_ids
+    }
+    for _, category_id, _ in task_type_refs:
+        actions_by_object[category_id] = []
+    queued = 0
+    completed = 0
+
+    task_id: TaskID | None = None
+    if progress:
+        task_id = progress.add_task(
+            "Fetching actions...", total=len(object_ids) + len(task_type_refs)
+        )
+
+    def update_progress() -> None:
+        if progress and task_id is not None:
+            progress.update(task_id, completed=completed, total=queued)
+
+    def put(job: Callable[[], Awaitable[None]]) -> None:
+        nonlocal queued
+        queue.put_nowait(job)
+        queued += 1
+        # Start workers as jobs arrive, so a small container doesn't spin
+        # up the full pool for a handful of requests
+        if len(workers) < max_concurrent:
+            workers.append(asyncio.create_task(worker()))
+
+    # (action list, position of the action in it, builder response)
+    builder_results: list[tuple[list[dict[str, Any]], int, dict[str, Any] | None]] = []
+
+    # Phase 2: Fetch builder details for mappable actions
+    async def fetch_builder(
+        actions: list[dict[str, Any]], position: int, action_id: str
+    ) -> None:
+        builder = await fetch_action_builder(client, action_id)
+        builder_results.append((actions, position, builder))
+
+    def queue_builders(actions: list[dict[str, Any]]) -> None:
+        for position, action in enumerate(actions):
+            if action.get("consequenceType") == "CALL_REST_API":
+                continue
+            params = action.get("consequenceParams") or {}
+            # Only enrich actions with mappable targets
+            if params.get("targetObjectType") in _MAPPABLE_TARGET_TYPES:
+                put(partial(fetch_builder, actions, position, str(action.get("id"))))
 
     # Phase 1: Fetch basic action lists
     # Forms/workflows use /objects/{id}/actions
-    async def fetch_object_with_semaphore(object_id: str) -> tuple[str, list[dict[str, Any]]]:
-        async with semaphore:
-            try:
-                actions = await fetch_object_actions(client, object_id)
-                return (object_id, actions)
-            except Exception as e:
-                msg = (
-                    f"[yellow]Warning: Failed to fetch actions for object {object_id}: "
-                    f"{e}[/yellow]"
-                )
-                console.print(msg)
-                return (object_id, [])
+    async def fetch_object_list(object_id: str) -> None:
+        try:
+            actions = await fetch_object_actions(client, object_id)
+        except Exception as e:
+            warnings.append(f"Warning: Failed to fetch actions for object {object_id}: {e}")
+            actions = []
+        if not keep_all:
+            actions = _mappable_actions(object_id, actions)
+        actions_by_object[object_id] = actions
+        queue_builders(actions)
 
     # Task types use /actions?object={id}&container={cid}
     # Key by categoryId for analyzer lookup
-    async def fetch_task_type_with_semaphore(
+    async def fetch_task_type_list(
         task_type_id: str,
         category_id: str,
         container_id: str
-    ) -> tuple[str, list[dict[str, Any]]]:
-        async with semaphore:
-            actions = await fetch_task_type_actions(client, task_type_id, container_id)
-            return (category_id, actions)  # Key by categoryId, not task_type id
-
-    tasks = [fetch_object_with_semaphore(obj_id) for obj_id in object_ids]
-
-    if task_type_refs:
-        tasks.extend([
-            fetch_task_type_with_semaphore(tt_id, cat_id, c_id)
-            for tt_id, cat_id, c_id in task_type_refs
-        ])
-
-    results = await asyncio.gather(*tasks)
-    actions_by_object = dict(results)
-
-    # Phase 2: Fetch builder details for mappable actions
-    # targetObjectType: 3=Task, 5=Form, 9=Workflow
-    # Skip REST API calls - they don't create cross-object relationships
-    mappable_types = {3, 5, 9}
-    actions_to_enrich = []
-
-    for object_id, actions in actions_by_object.items():
-        for action in actions:
-            # targetObjectType is inside consequenceParams, not at root level
-            params = action.get("consequenceParams") or {}
-            target_type = params.get("targetObjectType")
-            consequence_type = action.get("consequenceType")
-
-            # Skip REST API actions (no cross-object target)
-            if consequence_type == "CALL_REST_API":
-                continue
+    ) -> None:
+        actions = await fetch_task_type_actions(client, task_type_id, container_id)
+        if not keep_all:
+            actions = _mappable_actions(category_id, actions)
+        actions_by_object[category_id] = actions  # Key by categoryId, not task_type id
+        queue_builders(actions)
+
+    async def worker() -> None:
+        nonlocal completed
+        while True:
+            job = await queue.get()
+            try:
+                async with semaphore:
+                    await job()
+            except Exception as e:
+                errors.append(e)
+            finally:
+                completed += 1
+                if completed % _PROGRESS_BATCH == 0:
+                    update_progress()
+                queue.task_done()
+
+    for obj_id in object_ids:
+        put(partial(fetch_object_list, obj_id))
+    for tt_id, cat_id, c_id in task_type_refs:
+        put(partial(fetch_task_type_list, tt_id, cat_id, c_id))
 
-            # Only enrich actions with mappable targets
-            if target_type in mappable_types:
-                actions_to_enrich.append((object_id, action))
-            else:
-                # Debug: log why we're not enriching
-                if target_type is None:
-                    logger.debug(
-                        f"Action {action.get('id')} on {object_id}: "
-                        f"targetObjectType is None - may need builder fetch"
-                    )
-
-    if actions_to_enrich:
-        logger.info(
-            f"Fetching builder details for {len(actions_to_enrich)} mappable actions "
-            f"(out of {sum(len(acts) for acts in actions_by_object.values())} total)"
-        )
+    try:
+        await queue.join()
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+    update_progress()
+    if errors:
+        raise errors[0]
+
+    _print_warnings(warnings)
+
+    if builder_results:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Fetched builder details for %d mappable actions (out of %d total)",
+                len(builder_results),
+                sum(len(acts) for acts in actions_by_object.values()),
+            )
 
-        async def fetch_builder_with_semaphore(
-            object_id: str,
-            action: dict[str, Any]
-        ) -> tuple[str, str, dict[str, Any] | None]:
-            async with semaphore:
-                action_id = str(action.get("id"))
-                builder = await fetch_action_builder(client, action_id)
-                return (object_id, action_id, builder)
-
-        builder_tasks = [
-            fetch_builder_with_semaphore(obj_id, action)
-            for obj_id, action in actions_to_enrich
-        ]
-        builder_results = await asyncio.gather(*builder_tasks)
-
-        # Replace basic action data with full builder response
+        # Replace basic action data with full builder response, at the
+        # position recorded when the builder fetch was queued
         enriched_count = 0
-        for object_id, action_id, builder in builder_results:
+        for actions, position, builder in builder_results:
             if builder is None:
                 continue
 
-            # Find and replace the action in the original list
-            for i, action in enumerate(actions_by_object[object_id]):
-                if str(action.get("id")) == action_id:
-                    actions_by_object[object_id][i] = builder
-                    enriched_count += 1
-                    break
+            actions[position] = builder
+            enriched_count += 1
 
-        logger.info(f"Successfully enriched {enriched_count} actions with builder details")
+        logger.info("Successfully enriched %d actions with builder details", enriched_count)
 
     return actions_by_object
 
@@ -463,13 +765,28 @@ async def fetch_solution(
     client: VeociClient,
     container_id: str,
     progress: Progress | None = None,
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+    cache: DefinitionCache | None = None,
+    on_form_definitions: Callable[[list[dict[str, Any]]], None] | None = None,
+    semaphore: asyncio.Semaphore | None = None,
 ) -> dict[str, Any]:
     """
     Fetch complete solution data from a container.
 
+    Form definitions and actions are fetched concurrently, sharing one bound
+    of ``max_concurrent`` requests in flight (or ``semaphore``, to share it
+    with the caller's own fetches; ``max_concurrent`` should then match its
+    bound, as it also sizes the actions worker pool); form definitions are
+    revalidated against ``cache``. ``on_form_definitions`` is called with the definitions
+    as soon as they are all fetched, so callers can start processing them
+    while actions are still being fetched.
+
     Returns:
         dict with keys: forms, form_definitions, workflows, task_types, actions, container_id
     """
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max_concurrent)
+
     # Track progress if provided
     task_id: TaskID | None = None
     if progress:
@@ -479,78 +796,99 @@ async def fetch_solution(
         if progress and task_id is not None:
             progress.advance(task_id)
 
-    # 1. Fetch forms list
-    console.print("[dim]Fetching forms list...[/dim]")
-    forms = await fetch_forms_list(client, container_id)
-    console.print(f"[green]Found {len(forms)} forms[/green]")
-    advance()
-
-    # 2. Fetch workflows list
-    console.print("[dim]Fetching workflows list...[/dim]")
-    workflows = await fetch_workflows_list(client, container_id)
-    console.print(f"[green]Found {len(workflows)} workflows[/green]")
-    advance()
-
-    # 3. Fetch task types list
-    console.print("[dim]Fetching task types list...[/dim]")
-    task_types_list = await fetch_task_types_list(client, container_id)
-    console.print(f"[green]Found {len(task_types_list)} task types[/green]")
-    advance()
-
-    # 4. Fetch all form definitions in parallel
-    console.print(f"[dim]Fetching {len(forms)} form definitions...[/dim]")
-    form_definitions = await fetch_all_form_definitions(client, forms)
-    console.print(f"[green]Fetched {len(form_definitions)} form definitions[/green]")
-    advance()
-
-    # 5. Fetch custom actions for all forms, workflows, and task types
-    form_ids = [str(f.get("id") or f.get("formId")) for f in forms]
-    workflow_ids = [str(w.get("id")) for w in workflows if w.get("id")]
-
-    # Build task type refs: (id, categoryId, container_id)
-    # id is used for API call, categoryId is used as dict key
-    task_type_refs = [
-        (str(tt.get("id")), str(tt.get("categoryId")), container_id)
-        for tt in task_types_list
-        if tt.get("id") and tt.get("categoryId")
-    ]
-    task_type_category_ids = [cat_id for _, cat_id, _ in task_type_refs]
-
-    all_object_ids = form_ids + workflow_ids
-
-    msg = (
-        f"[dim]Fetching actions for {len(all_object_ids) + len(task_type_refs)} objects "
-        f"({len(form_ids)} forms, {len(workflow_ids)} workflows, "
-        f"{len(task_type_refs)} task types)...[/dim]"
-    )
-    console.print(msg)
-    actions = await fetch_all_object_actions(
-        client,
-        all_object_ids,
-        task_type_refs=task_type_refs
-    )
+    # 1-3. Fetch forms, workflows and task types lists (independent, so concurrently)
+    console.print("[dim]Fetching forms, workflows and task types lists...[/dim]")
+    # A failure anywhere (e.g. a 401 on one list) cancels the sibling
+    # fetches instead of letting them run on with nowhere to report to
+    try:
+        async with asyncio.TaskGroup() as tasks:
+            workflows_task = tasks.create_task(fetch_workflows_list(client, container_id))
+            task_types_task = tasks.create_task(fetch_task_types_list(client, container_id))
+            forms = await fetch_forms_list(client, container_id)
+            console.print(f"[green]Found {len(forms)} forms[/green]")
+            advance()
+
+            # 4. Fetch all form definitions in parallel, starting as soon as the forms
+            # list is in; they overlap the other lists and the actions fetch below
+            console.print(f"[dim]Fetching {len(forms)} form definitions...[/dim]")
+
+            async def fetch_definitions() -> list[dict[str, Any]]:
+                form_definitions = await fetch_all_form_definitions(
+                    client, forms, cache=cache, progress=progress, semaphore=semaphore
+                )
+                console.print(f"[green]Fetched {len(form_definitions)} form definitions[/green]")
+                advance()
+                if on_form_definitions:
+                    on_form_definitions(form_definitions)
+                return form_definitions
+
+            definitions_task = tasks.create_task(fetch_definitions())
+
+            workflows = await workflows_task
+            task_types_list = await task_types_task
+            console.print(f"[green]Found {len(workflows)} workflows[/green]")
+            advance()
+            console.print(f"[green]Found {len(task_types_list)} task types[/green]")
+            advance()
+
+            # 5. Fetch custom actions for all forms, workflows, and task types
+            form_ids = [str(f.get("id") or f.get("formId")) for f in forms]
+            workflow_ids = [str(w.get("id")) for w in workflows if w.get("id")]
+
+            # Build task type refs: (id, categoryId, container_id)
+            # id is used for API call, categoryId is used as dict key
+            task_type_refs = [
+                (str(tt.get("id")), str(tt.get("categoryId")), container_id)
+                for tt in task_types_list
+                if tt.get("id") and tt.get("categoryId")
+            ]
+            task_type_category_ids = [cat_id for _, cat_id, _ in task_type_refs]
+
+            all_object_ids = form_ids + workflow_ids
+
+            msg = (
+                f"[dim]Fetching actions for {len(all_object_ids) + len(task_type_refs)} objects "
+                f"({len(form_ids)} forms, {len(workflow_ids)} workflows, "
+                f"{len(task_type_refs)} task types)...[/dim]"
+            )
+            console.print(msg)
+            actions = await fetch_all_object_actions(
+                client,
+                all_object_ids,
+                task_type_refs=task_type_refs,
+                max_concurrent=max_concurrent,
+                progress=progress,
+                semaphore=semaphore,
+            )
 
-    # Count actions by type for logging
-    form_action_count = sum(len(actions.get(fid, [])) for fid in form_ids)
-    workflow_action_count = sum(len(actions.get(wid, [])) for wid in workflow_ids)
-    task_type_action_count = sum(len(actions.get(cat_id, [])) for cat_id in task_type_category_ids)
-    console.print(
-        f"[green]Fetched {form_action_count} form actions, "
-        f"{workflow_action_count} workflow actions, "
-        f"{task_type_action_count} task type actions[/green]"
-    )
+            # Count actions by type for logging
+            form_action_count = sum(len(actions.get(fid, [])) for fid in form_ids)
+            workflow_action_count = sum(len(actions.get(wid, [])) for wid in workflow_ids)
+            task_type_action_count = sum(
+                len(actions.get(cat_id, [])) for cat_id in task_type_category_ids
+            )
+            console.print(
+                f"[green]Fetched {form_action_count} form actions, "
+                f"{workflow_action_count} workflow actions, "
+                f"{task_type_action_count} task type actions[/green]"
+            )
 
-    # Debug: Check action data structure
-    if actions:
-        sample_obj_id = next(iter(actions.keys()))
-        sample_actions = actions[sample_obj_id]
-        if sample_actions:
-            sample = sample_actions[0]
-            logger.debug(f"Sample action from {sample_obj_id}: {list(sample.keys())}")
-            logger.debug(f"  targetObjectType: {sample.get('targetObjectType')}")
-            logger.debug(f"  consequenceParams: {sample.get('consequenceParams', {})}")
-
-    advance()
+            # Debug: Check action data structure
+            if actions and logger.isEnabledFor(logging.DEBUG):
+                sample_obj_id = next(iter(actions.keys()))
+                sample_actions = actions[sample_obj_id]
+                if sample_actions:
+                    sample = sample_actions[0]
+                    logger.debug("Sample action from %s: %s", sample_obj_id, list(sample.keys()))
+                    logger.debug("  targetObjectType: %s", sample.get("targetObjectType"))
+                    logger.debug("  consequenceParams: %s", sample.get("consequenceParams", {}))
+
+            advance()
+    except ExceptionGroup as group:
+        # Surface the API error itself (AuthenticationError, ...) to callers
+        raise group.exceptions[0]
+
+    form_definitions = definitions_task.result()
 
     return {
         "container_id": container_id,
@@ -1,10 +1,87 @@
 """Build NetworkX graph from solution relationships."""
 
+import heapq
+from collections import Counter
+from operator import itemgetter
 from typing import Any
 
 import networkx as nx
 
 from veoci_mapper.analyzer import Relationship
+from veoci_mapper.models import intern_id
+
+
+def _container(container_id: Any) -> str | None:
+    return intern_id(container_id) if container_id else None
+
+
+def _form_node(
+    form: dict[str, Any], default_container_id: str | None
+) -> tuple[str, dict[str, Any]]:
+    form_id = intern_id(form.get("id") or form.get("formId"))
+    # External forms may have their own containerId, otherwise use solution container
+    container_id = form.get("containerId")
+    return form_id, {
+        "name": form.get("name", "Unknown"),
+        "node_type": "form",
+        "external": form.get("external", False),
+        "container_id": intern_id(container_id) if container_id else default_container_id,
+    }
+
+
+def _workflow_node(
+    workflow: dict[str, Any], default_container_id: str | None
+) -> tuple[str, dict[str, Any]]:
+    workflow_id = intern_id(workflow.get("id") or workflow.get("processId"))
+    # External workflows may have their own containerId, otherwise use solution container
+    container_id = workflow.get("containerId")
+    return workflow_id, {
+        "name": workflow.get("name", "Unknown"),
+        "node_type": "workflow",
+        "container_id": intern_id(container_id) if container_id else default_container_id,
+    }
+
+
+def _task_type_node(task_type: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+    # Use categoryId as the canonical identifier (referenced by TASK fields)
+    task_type_id = intern_id(task_type.get("categoryId"))
+    return task_type_id, {
+        "name": task_type.get("name", "Unknown"),
+        "node_type": "task_type",
+        "external": task_type.get("external", False),
+        "container_id": _container(task_type.get("container", {}).get("id")),
+    }
+
+
+def _edge_data(rel: Relationship) -> dict[str, Any]:
+    # Each kind is one literal, so the dict is allocated at its final size
+    # instead of growing key by key
+    edge_data: dict[str, Any]
+    if rel.action_id:
+        # Action edges carry the action metadata
+        edge_data = {
+            "relationship_type": rel.relationship_type,
+            "field_name": rel.field_name,
+            "target_type": rel.target_type,
+            "action_id": rel.action_id,
+            "action_name": rel.action_name,
+            "trigger_type": rel.trigger_type,
+            "automatic": rel.automatic,
+            "edge_category": "action",
+        }
+    else:
+        edge_data = {
+            "relationship_type": rel.relationship_type,
+            "field_name": rel.field_name,
+            "target_type": rel.target_type,
+            "edge_category": "field",
+        }
+
+    # Add is_subform if present (for REFERENCE relationships)
+    if rel.is_subform is not None:
+        edge_data["is_subform"] = rel.is_subform
+
+    return edge_data
 
 
 def build_graph(
@@ -23,124 +100,91 @@ def build_graph(
     graph = nx.DiGraph()
     task_types = task_types or []
 
+    # Nodes and edges are added in one add_*_from call per kind, which
+    # iterates inside NetworkX instead of one Python-level call per element
+
+    # Coerced once, for every form and workflow without its own containerId
+    default_container_id = _container(solution_container_id)
+
     # Add form nodes
-    for form in forms:
-        form_id = str(form.get("id") or form.get("formId"))
-        is_external = form.get("external", False)
-        # External forms may have their own containerId, otherwise use solution container
-        container_id = form.get("containerId") or solution_container_id
-        graph.add_node(
-            form_id,
-            name=form.get("name", "Unknown"),
-            node_type="form",
-            external=is_external,
-            container_id=str(container_id) if container_id else None,
-        )
+    graph.add_nodes_from(_form_node(form, default_container_id) for form in forms)
 
     # Add workflow nodes
-    for workflow in workflows:
-        workflow_id = str(workflow.get("id") or workflow.get("processId"))
-        # External workflows may have their own containerId, otherwise use solution container
-        container_id = workflow.get("containerId") or solution_container_id
-        graph.add_node(
-            workflow_id,
-            name=workflow.get("name", "Unknown"),
-            node_type="workflow",
-            container_id=str(container_id) if container_id else None,
-        )
+    graph.add_nodes_from(
+        _workflow_node(workflow, default_container_id) for workflow in workflows
+    )
 
     # Add task type nodes
-    for task_type in task_types:
-        # Use categoryId as the canonical identifier (referenced by TASK fields)
-        task_type_id = str(task_type.get("categoryId"))
-        is_external = task_type.get("external", False)
-        container_id = task_type.get("container", {}).get("id")
-        graph.add_node(
-            task_type_id,
-            name=task_type.get("name", "Unknown"),
-            node_type="task_type",
-            external=is_external,
-            container_id=str(container_id) if container_id else None,
-        )
+    graph.add_nodes_from(_task_type_node(task_type) for task_type in task_types)
 
     # Add relationship edges
-    for rel in relationships:
-        edge_data = {
-            "relationship_type": rel.relationship_type,
-            "field_name": rel.field_name,
-            "target_type": rel.target_type,
-        }
-
-        # Add action metadata if present
-        if rel.action_id:
-            edge_data["action_id"] = rel.action_id
-            edge_data["action_name"] = rel.action_name
-            edge_data["trigger_type"] = rel.trigger_type
-            edge_data["automatic"] = rel.automatic
-            edge_data["edge_category"] = "action"
-        else:
-            edge_data["edge_category"] = "field"
-
-        # Add is_subform if present (for REFERENCE relationships)
-        if rel.is_subform is not None:
-            edge_data["is_subform"] = rel.is_subform
-
-        graph.add_edge(rel.source_id, rel.target_id, **edge_data)
+    graph.add_edges_from(
+        (rel.source_id, rel.target_id, _edge_data(rel)) for rel in relationships
+    )
 
     return graph
 
 
 def get_graph_stats(graph: nx.DiGraph) -> dict[str, Any]:
     """Get statistics about the solution graph."""
-    form_nodes = [n for n, d in graph.nodes(data=True) if d.get("node_type") == "form"]
-    workflow_nodes = [n for n, d in graph.nodes(data=True) if d.get("node_type") == "workflow"]
-    task_type_nodes = [n for n, d in graph.nodes(data=True) if d.get("node_type") == "task_type"]
+    # Count nodes by type in one pass, reading just that attribute
+    node_types = Counter(node_type for _, node_type in graph.nodes(data="node_type"))
 
     # Count edges by relationship type and category
-    edge_types: dict[str, int] = {}
-    action_edges = 0
-    field_edges = 0
+    edge_types: Counter[str] = Counter()
+    edge_categories: Counter[str | None] = Counter()
     for _, _, data in graph.edges(data=True):
-        rel_type = data.get("relationship_type", "unknown")
-        edge_types[rel_type] = edge_types.get(rel_type, 0) + 1
-
-        # Count by edge category
-        if data.get("edge_category") == "action":
-            action_edges += 1
-        elif data.get("edge_category") == "field":
-            field_edges += 1
+        edge_types[data.get("relationship_type", "unknown")] += 1
+        edge_categories[data.get("edge_category")] += 1
 
-    # Find isolated nodes (no connections)
-    isolated = list(nx.isolates(graph))
+    # Count isolated nodes (no connections) without collecting them
+    isolated = sum(1 for _ in nx.isolates(graph))
 
-    # Find most connected nodes
-    in_degrees = sorted(graph.in_degree(), key=lambda x: x[1], reverse=True)[:5]
-    out_degrees = sorted(graph.out_degree(), key=lambda x: x[1], reverse=True)[:5]
+    # Find most connected nodes (a bounded heap, not a sort of every node;
+    # ties keep node order, as a stable sort would)
+    in_degrees = heapq.nlargest(5, graph.in_degree(), key=itemgetter(1))
+    out_degrees = heapq.nlargest(5, graph.out_degree(), key=itemgetter(1))
 
     return {
         "total_nodes": graph.number_of_nodes(),
-        "form_count": len(form_nodes),
-        "workflow_count": len(workflow_nodes),
-        "task_type_count": len(task_type_nodes),
+        "form_count": node_types["form"],
+        "workflow_count": node_types["workflow"],
+        "task_type_count": node_types["task_type"],
         "total_edges": graph.number_of_edges(),
-        "action_edges": action_edges,
-        "field_edges": field_edges,
-        "edge_types": edge_types,
-        "isolated_nodes": len(isolated),
+        "action_edges": edge_categories["action"],
+        "field_edges": edge_categories["field"],
+        "edge_types": dict(edge_types),
+        "isolated_nodes": isolated,
         "connected_components": nx.number_weakly_connected_components(graph),
-        "most_referenced": [
-            {"id": n, "name": graph.nodes[n].get("name"), "count": c}
-            for n, c in in_degrees
-            if c > 0
-        ],
-        "most_referencing": [
-            {"id": n, "name": graph.nodes[n].get("name"), "count": c}
-            for n, c in out_degrees
-            if c > 0
-        ],
+        "most_referenced": _top_nodes(graph, in_degrees),
+        "most_referencing": _top_nodes(graph, out_degrees),
     }
 
 
+def _top_nodes(graph: nx.DiGraph, degrees: list[tuple[str, int]]) -> list[dict[str, Any]]:
+    """Describe the nodes of (node, degree) pairs that have any connections."""
+    return [{"id": n, "name": graph.nodes[n].get("name"), "count": c} for n, c in degrees if c > 0]
+
+
+def _neighbors(graph: nx.DiGraph, adjacency: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Describe the neighbors in one of a node's adjacency dicts (pred or succ).
+
+    These map each neighbor to its edge data, so no edge lookup is needed.
+    Edge targets added implicitly have no name, hence .get().
+    """
+    nodes = graph.nodes
+    return [
+        {
+            "id": neighbor,
+            "name": nodes[neighbor].get("name"),
+            "relationship": edge_data.get("relationship_type"),
+            "field": edge_data.get("field_name"),
+        }
+        for neighbor, edge_data in adjacency.items()
+    ]
+
+
 def get_node_neighbors(graph: nx.DiGraph, node_id: str) -> dict[str, Any]:
     """Get information about a node's connections."""
     if node_id not in graph:
@@ -148,36 +192,12 @@ def get_node_neighbors(graph: nx.DiGraph, node_id: str) -> dict[str, Any]:
 
     node_data = graph.nodes[node_id]
 
-    # Incoming edges (who references this node)
-    predecessors = []
-    for pred in graph.predecessors(node_id):
-        edge_data = graph.edges[pred, node_id]
-        predecessors.append(
-            {
-                "id": pred,
-                "name": graph.nodes[pred].get("name"),
-                "relationship": edge_data.get("relationship_type"),
-                "field": edge_data.get("field_name"),
-            }
-        )
-
-    # Outgoing edges (what this node references)
-    successors = []
-    for succ in graph.successors(node_id):
-        edge_data = graph.edges[node_id, succ]
-        successors.append(
-            {
-                "id": succ,
-                "name": graph.nodes[succ].get("name"),
-                "relationship": edge_data.get("relationship_type"),
-                "field": edge_data.get("field_name"),
-            }
-        )
-
     return {
         "id": node_id,
         "name": node_data.get("name"),
         "type": node_data.get("node_type"),
-        "referenced_by": predecessors,
-        "references": successors,
+        # Incoming edges (who references this node)
+        "referenced_by": _neighbors(graph, graph.pred[node_id]),
+        # Outgoing edges (what this node references)
+        "references": _neighbors(graph, graph.succ[node_id]),
     }
@@ -0,0 +1,47 @@
+"""Public data models for veoci-mapper.
+
+Kept separate from ``analyzer`` so the analyzer stays free of Pydantic model
+definitions and can be compiled with mypyc (see ``build/compile_analyzer.py``).
+"""
+
+import sys
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+
+def intern_id(value: Any) -> str:
+    """Coerce an ID to an interned str, skipping str() when it already is one.
+
+    The same IDs recur across many relationships and graph nodes; interning
+    makes every occurrence share one object, so key hashing and equality
+    checks short-circuit on identity.
+    """
+    return sys.intern(value if type(value) is str else str(value))
+
+
+class Relationship(BaseModel):
+    """A relationship between forms or to workflows.
+
+    Instances are built from already-typed extraction records via
+    ``model_construct`` (no validation pass) and are immutable once created.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid", validate_assignment=False)
+
+    source_id: str
+    source_name: str
+    target_id: str
+    target_name: str | None
+    target_type: str  # "form" or "workflow"
+    relationship_type: str  # REFERENCE, FORM_ENTRY, LOOKUP, WORKFLOW, ACTION_*
+    field_name: str | None = None  # Optional - actions don't have field names
+    # Action metadata (only populated for action-based relationships)
+    action_id: str | None = None
+    action_name: str | None = None
+    trigger_type: str | None = None
+    automatic: bool | None = None
+    # Task type metadata (only populated for task_type relationships)
+    target_container_id: str | None = None
+    # Reference type metadata (only populated for REFERENCE relationships)
+    is_subform: bool | None = None
@@ -1,14 +1,40 @@
 """Output modules for solution mapper."""
 
-from veoci_mapper.output.json_output import export_json, SolutionExport
-from veoci_mapper.output.markdown import (
-    generate_markdown_summary,
-    export_markdown,
-    generate_basic_markdown,
-)
-from veoci_mapper.output.visual import export_html
-from veoci_mapper.output.mermaid import export_mermaid
-from veoci_mapper.output.dashboard import export_dashboard, open_in_browser
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from veoci_mapper.output.dashboard import (
+        export_dashboard,
+        generate_dashboard_html,
+        open_in_browser,
+        write_dashboard,
+    )
+    from veoci_mapper.output.json_output import SolutionExport, export_json
+    from veoci_mapper.output.markdown import (
+        export_markdown,
+        generate_basic_markdown,
+        generate_markdown_summary,
+    )
+    from veoci_mapper.output.mermaid import export_mermaid
+    from veoci_mapper.output.visual import export_html
+
+# Public name -> defining submodule. Each format pulls in its own libraries
+# (pydantic, markdown, ...), so a backend is imported on first attribute
+# access (PEP 562) and formats that aren't written never load theirs.
+_LAZY_IMPORTS = {
+    "export_json": "veoci_mapper.output.json_output",
+    "SolutionExport": "veoci_mapper.output.json_output",
+    "generate_markdown_summary": "veoci_mapper.output.markdown",
+    "export_markdown": "veoci_mapper.output.markdown",
+    "generate_basic_markdown": "veoci_mapper.output.markdown",
+    "export_html": "veoci_mapper.output.visual",
+    "export_mermaid": "veoci_mapper.output.mermaid",
+    "export_dashboard": "veoci_mapper.output.dashboard",
+    "generate_dashboard_html": "veoci_mapper.output.dashboard",
+    "write_dashboard": "veoci_mapper.output.dashboard",
+    "open_in_browser": "veoci_mapper.output.dashboard",
+}
 
 __all__ = [
     "export_json",
@@ -19,5 +45,22 @@ __all__ = [
     "export_html",
     "export_mermaid",
     "export_dashboard",
+    "generate_dashboard_html",
+    "write_dashboard",
     "open_in_browser",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names from their submodule on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -11,6 +11,10 @@ from rich.console import Console
 
 console = Console()
 
+# Stands in for the AI summary in a dashboard rendered before the summary is
+# ready; write_dashboard() replaces it
+_SUMMARY_PLACEHOLDER = "<!-- veoci-map:summary -->"
+
 
 def wrap_label(name: str, max_chars: int = 25) -> str:
     """Wrap label text and truncate if needed for external node labels."""
@@ -63,10 +67,15 @@ def generate_dashboard_html(
     relationships: list[Any],  # Relationship objects
     stats: dict[str, Any],
     graph: nx.DiGraph,
-    markdown_summary: str,
+    markdown_summary: str | None,
     base_url: str,
 ) -> str:
-    """Generate unified HTML dashboard with tabs."""
+    """
+    Generate unified HTML dashboard with tabs.
+
+    With ``markdown_summary=None`` the summary tab is left as a placeholder
+    for write_dashboard(), so the rest can be rendered while it is generated.
+    """
 
     # Build nodes and edges data for vis.js
     nodes_data = []
@@ -161,7 +170,10 @@ def generate_dashboard_html(
                 }
             )
 
-    # Build forms table data including task types
+    # Build forms table data including task types; degrees are read from
+    # lookups built once rather than by listing each node's neighbors
+    refs_out_by_node = dict(graph.out_degree())
+    refs_in_by_node = dict(graph.in_degree())
     forms_table = []
     for form in forms:
         form_id = str(form.get("id") or form.get("formId"))
@@ -169,8 +181,8 @@ def generate_dashboard_html(
         is_external = form.get("external", False)
 
         # Count relationships
-        refs_out = len(list(graph.successors(form_id))) if form_id in graph else 0
-        refs_in = len(list(graph.predecessors(form_id))) if form_id in graph else 0
+        refs_out = refs_out_by_node.get(form_id, 0)
+        refs_in = refs_in_by_node.get(form_id, 0)
 
         forms_table.append(
             {
@@ -186,8 +198,8 @@ def generate_dashboard_html(
     for workflow in workflows:
         wf_id = str(workflow.get("id") or workflow.get("processId"))
         name = workflow.get("name", "Unknown")
-        refs_out = len(list(graph.successors(wf_id))) if wf_id in graph else 0
-        refs_in = len(list(graph.predecessors(wf_id))) if wf_id in graph else 0
+        refs_out = refs_out_by_node.get(wf_id, 0)
+        refs_in = refs_in_by_node.get(wf_id, 0)
 
         forms_table.append(
             {
@@ -203,8 +215,8 @@ def generate_dashboard_html(
     for node_id, data in graph.nodes(data=True):
         if data.get("node_type") == "task_type":
             is_external = data.get("external", False)
-            refs_out = len(list(graph.successors(node_id))) if node_id in graph else 0
-            refs_in = len(list(graph.predecessors(node_id))) if node_id in graph else 0
+            refs_out = refs_out_by_node.get(node_id, 0)
+            refs_in = refs_in_by_node.get(node_id, 0)
 
             forms_table.append(
                 {
@@ -217,8 +229,9 @@ def generate_dashboard_html(
                 }
             )
 
-    # Convert markdown to HTML using markdown library
-    markdown_html = markdown.markdown(markdown_summary, extensions=["tables", "fenced_code"])
+    markdown_html = (
+        _SUMMARY_PLACEHOLDER if markdown_summary is None else _summary_html(markdown_summary)
+    )
 
     html = f"""<!DOCTYPE html>
 <html lang="en">
@@ -1711,6 +1724,22 @@ def markdown_to_html(markdown: str) -> str:
     return "\n".join(result)
 
 
+def _summary_html(markdown_summary: str) -> str:
+    """Convert markdown to HTML using markdown library."""
+    return markdown.markdown(markdown_summary, extensions=["tables", "fenced_code"])
+
+
+def write_dashboard(html: str, markdown_summary: str, output_path: Path) -> Path:
+    """Fill the summary into a dashboard generated without one and write it."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    html = html.replace(_SUMMARY_PLACEHOLDER, _summary_html(markdown_summary), 1)
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(html)
+
+    return output_path
+
+
 def export_dashboard(
     container_id: str,
     forms: list[dict[str, Any]],
@@ -1723,8 +1752,6 @@ def export_dashboard(
     base_url: str,
 ) -> Path:
     """Export unified dashboard HTML."""
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
     html = generate_dashboard_html(
         container_id=container_id,
         forms=forms,
@@ -1732,14 +1759,10 @@ def export_dashboard(
         relationships=relationships,
         stats=stats,
         graph=graph,
-        markdown_summary=markdown_summary,
+        markdown_summary=None,
         base_url=base_url,
     )
-
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html)
-
-    return output_path
+    return write_dashboard(html, markdown_summary, output_path)
 
 
 def open_in_browser(path: Path) -> bool:
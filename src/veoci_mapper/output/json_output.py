@@ -1,6 +1,5 @@
 """JSON export for solution map."""
 
-import json
 from pathlib import Path
 from typing import Any
 
@@ -57,8 +56,8 @@ def export_json(
         statistics=stats,
     )
 
-    # Write JSON with pretty formatting
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(export.model_dump(), f, indent=2, ensure_ascii=False)
+    # Serialize straight to UTF-8 bytes with pydantic-core's encoder, skipping
+    # the intermediate dict copy and the pure-Python json encoder
+    output_path.write_bytes(export.model_dump_json(indent=2).encode("utf-8"))
 
     return output_path
@@ -21,15 +21,17 @@ def generate_summary_prompt(
 ) -> str:
     """Generate the prompt for Gemini to summarize the solution."""
 
-    # Build form list with relationships
+    # Build form list with relationships, from the graph's adjacency dicts
+    successors = graph.succ
+    predecessors = graph.pred
     form_details = []
     for form in forms:
         form_id = str(form.get("id") or form.get("formId"))
         name = form.get("name", "Unknown")
 
         # Get relationships for this form
-        refs_out = list(graph.successors(form_id)) if form_id in graph else []
-        refs_in = list(graph.predecessors(form_id)) if form_id in graph else []
+        refs_out = list(successors.get(form_id, ()))
+        refs_in = list(predecessors.get(form_id, ()))
 
         detail = f"- {name}"
         if refs_out:
@@ -1,6 +1,4 @@
 """Version checking for veoci-mapper."""
-import json
-import urllib.request
 from typing import Optional
 
 # Current version - updated on release
@@ -16,6 +14,10 @@ def check_for_update() -> Optional[str]:
     Returns new version string if available, None otherwise.
     Non-blocking - returns None on any error (network, parse, etc.)
     """
+    # Imported here so reading __version__ stays import-free
+    import json
+    import urllib.request
+
     try:
         req = urllib.request.Request(
             RELEASES_URL,
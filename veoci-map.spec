@@ -2,6 +2,8 @@
 """PyInstaller spec file for veoci-map standalone executable."""
 
 import sys
+from pathlib import Path
+
 from PyInstaller.utils.hooks import collect_data_files, collect_submodules
 
 block_cipher = None
@@ -10,29 +12,44 @@ block_cipher = None
 hiddenimports = collect_submodules('questionary') + collect_submodules('prompt_toolkit') + [
     # veoci_mapper package
     'veoci_mapper',
+    'veoci_mapper.__main__',
+    'veoci_mapper.cache',
     'veoci_mapper.config',
     'veoci_mapper.version',
     'veoci_mapper.cli',
     'veoci_mapper.client',
     'veoci_mapper.analyzer',
+    'veoci_mapper.models',
     'veoci_mapper.fetcher',
     'veoci_mapper.graph',
-    # output subpackage
+    # output subpackage (backends are imported lazily by name)
     'veoci_mapper.output',
     'veoci_mapper.output.dashboard',
-    'veoci_mapper.output.json',
+    'veoci_mapper.output.json_output',
     'veoci_mapper.output.markdown',
     'veoci_mapper.output.mermaid',
+    'veoci_mapper.output.visual',
     # Dependencies that may have hidden imports
     'google.genai',
     'google.ai.generativelanguage',
     'networkx',
+    'h2',
+    'orjson',
     'markdown',
     'typer',
     'click',
     'rich',
 ]
 
+# libuv event loop for the HTTP fan-out; imported lazily by cli._run_async and
+# its Cython extension modules are not found by static analysis
+if sys.platform != 'win32':
+    hiddenimports += collect_submodules('uvloop')
+
+# mypyc-compiled analyzer (build/compile_analyzer.py) loads its runtime from C
+if any(Path('src/veoci_mapper').glob('analyzer__mypyc*')):
+    hiddenimports.append('veoci_mapper.analyzer__mypyc')
+
 # Collect package data files if any
 datas = []
 datas += collect_data_files('google.genai', include_py_files=True)
@@ -58,7 +75,7 @@ excludes = [
 ]
 
 a = Analysis(
-    ['src/veoci_mapper/cli.py'],
+    ['src/veoci_mapper/__main__.py'],
     pathex=[],
     binaries=[],
     datas=datas,